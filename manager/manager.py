@@ -4,7 +4,11 @@ import json
 import yaml
 import time
 from os import path, listdir
-from module.opensearchclient import ManageRemoteMonitors
+from module.opensearchclient import (
+    ManageRemoteMonitors,
+    DryRunRemoteMonitors,
+    OpenSearchHTTPError,
+)
 from module.localstorage import ManageLocalMonitors
 from module.comparator import Comparator
 from module.config import Configuration
@@ -21,8 +25,13 @@ from rich import print_json
 import argparse
 import sys
 
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
 
-class main:
+
+def main():
     exec_start = time.time()
     parser = argparse.ArgumentParser(
         description="""Aiven Monitor Manager syncs OpenSearch monitors with a local repository. 
@@ -135,7 +144,7 @@ and to validate monitors based on customizable validators."""
         "--filter",
         nargs="?",
         type=str,
-        help="filter monitors by case-insensitive string match in monitor name",
+        help="filter monitors by case-insensitive string match in monitor name, separate multiple terms with commas",
         action="store",
         metavar="filter",
         default=False,
@@ -151,7 +160,7 @@ and to validate monitors based on customizable validators."""
         parser.print_help()
         sys.exit(0)
 
-    helper = helper(arg)
+    util = helper(arg)
     console = Console()  # Initialize rich text output
 
     if not arg.force:
@@ -171,153 +180,183 @@ and to validate monitors based on customizable validators."""
     config_handler = Configuration(arg)
     config = config_handler.read_config()  # Parse configuration file
 
-    if arg.filter:
-        config["filter"] = arg.filter
-    else:
-        config["filter"] = None
+    config["filter"] = util.compile_filter(arg.filter)
 
-    notify = SlackMessageBuilder(config)
-    do_notify = False
+    if arg.sync:
+        notify = SlackMessageBuilder(config)
 
     instance_counter = 0
-    for instance in config["instances"]["opensearch"]:
-        if instance["active"]:
-            if "rename-me" in instance["name"]:
-                helper.error(
-                    f'Instance {instance["name"]} active but not named. Please edit the configuration template and '
-                    f"define your own instances. "
-                )
-                exit(1)
-            instance_counter += 1
-            print(
-                f"\n[bold]Processing OpenSearch instance {instance['name']}...[/bold]"
-            )
-            if arg.filter:
+    try:
+        for instance in config["instances"]["opensearch"]:
+            if instance["active"]:
+                if "rename-me" in instance["name"]:
+                    util.error(
+                        f'Instance {instance["name"]} active but not named. Please edit the configuration template and '
+                        f"define your own instances. "
+                    )
+                    exit(1)
+                instance_counter += 1
                 print(
-                    f" - Filtering results with case-insensitive term match for '{arg.filter}' in monitor name"
+                    f"\n[bold]Processing OpenSearch instance {instance['name']}...[/bold]"
                 )
-            notify.add(f"Aiven Monitor Manager", "header", "plain_text")
-            # Initialize local and remote handlers
-            remote = ManageRemoteMonitors(config, instance, arg)
-            local = ManageLocalMonitors(config, instance, arg)
-            compare = Comparator(config)
-            validate = Validate(config, arg)
-
-            local.load_monitors()
-            remote.load_monitors()
-            channels = remote.get_notification_channels()
-
-            if any(
-                (arg.info, arg.alerts, arg.severity, arg.size, arg.state, arg.validate)
-            ):
-                alerts = remote.get_alerts()
-
-            print(
-                f" - Loaded {len(remote.monitors)} remote and {len(local.monitors)} local monitors."
-            )
-
-            if arg.validate != False:
-                table = Table()
-                output = []
-                columns = [
-                    {"name": "Monitor", "justify": "left", "no_wrap": True},
-                    {"name": "Enabled", "justify": "center", "no_wrap": True},
-                    {"name": "Mustache", "justify": "center", "no_wrap": True},
-                    {"name": "OpsGenie", "justify": "center", "no_wrap": True},
-                    {"name": "Slack", "justify": "center", "no_wrap": True},
-                    {"name": "Destination", "justify": "left", "no_wrap": True},
-                    {"name": "Errors", "justify": "left", "no_wrap": False},
-                ]
-
-                for column in columns:
-                    table.add_column(
-                        column["name"],
-                        justify=column["justify"],
-                        no_wrap=column["no_wrap"],
+                if arg.filter:
+                    print(
+                        f" - Filtering results with case-insensitive term match for '{arg.filter}' in monitor name"
                     )
+                # Only query OpenSearch for the data the selected commands use
+                need_alerts = any(
+                    (arg.info, arg.alerts, arg.severity, arg.size, arg.state)
+                )
+                need_remote_monitors = arg.sync or need_alerts
+                need_channels = need_remote_monitors or arg.validate
+                need_remote = need_channels or arg.run
 
-                for monitor in local.monitors.items():
-                    monitor = monitor[1]
-                    validate.init_errors(monitor)
-                    e = validate.enabled(monitor)
-                    m = validate.mustache(monitor)
-                    n = validate.channels(monitor, channels)
-                    o = "-", "-"
-                    s = "-", "-"
-                    if "slack" in n[2].lower():
-                        s = validate.slack(monitor)
-                        o = True, "-"
-                    if "opsgenie" in n[2].lower():
-                        if "heartbeat" not in n[2].lower():
-                            o = validate.opsgenie(monitor)
-                            s = True, "-"
-                        else:
-                            o = True, "-"
-                            s = True, "-"
-                    output.append(
-                        f"{monitor['monitor']['name']}|{e[1]}|{m[1]}|{o[1]}|{s[1]}|{n[1]} {n[2]}"
-                    )
+                # Initialize local and remote handlers
+                local = ManageLocalMonitors(config, instance, arg)
+                local.load_monitors()
 
-                output.sort()
-                for line in output:
-                    i = line.split("|")
-                    errors = []
-                    try:
-                        for error in validate.errors[i[0]]:
-                            errors.append(f"- {error}")
-                        printable_errors = "\n".join(errors)
-                    except KeyError:
-                        printable_errors = ""
-
-                    table.add_row(i[0], i[1], i[2], i[3], i[4], i[5], printable_errors)
-                console.print(table)
-
-            if arg.info:
-                view = View(local.monitors, remote.monitors, arg, config)
-                compare.compare_monitors(local.monitors, remote.monitors)
-                print(f" - Showing monitor information.")
-                try:
-                    view.monitor_info(compare.monitor_diff, alerts, channels)
-                except KeyError as e:
-                    helper.error(
-                        "Notification channel not found - please validate monitors with --validate.",
-                        f"{e.__class__.__name__}: {e}",
+                if need_remote:
+                    if arg.dryrun:
+                        remote = DryRunRemoteMonitors(config, instance, arg)
+                    else:
+                        remote = ManageRemoteMonitors(config, instance, arg)
+                if need_remote_monitors:
+                    remote.load_monitors()
+                    compare = Comparator(config)
+                if need_channels:
+                    channels = remote.get_notification_channels()
+                if need_alerts:
+                    alerts = remote.get_alerts()
+
+                if need_remote_monitors:
+                    print(
+                        f" - Loaded {len(remote.monitors)} remote and {len(local.monitors)} local monitors."
                     )
+                else:
+                    print(f" - Loaded {len(local.monitors)} local monitors.")
+
+                if arg.validate != False:
+                    validate = Validate(config, arg)
+                    table = Table()
+                    output = []
+                    columns = [
+                        {"name": "Monitor", "justify": "left", "no_wrap": True},
+                        {"name": "Enabled", "justify": "center", "no_wrap": True},
+                        {"name": "Mustache", "justify": "center", "no_wrap": True},
+                        {"name": "OpsGenie", "justify": "center", "no_wrap": True},
+                        {"name": "Slack", "justify": "center", "no_wrap": True},
+                        {"name": "Destination", "justify": "left", "no_wrap": True},
+                        {"name": "Errors", "justify": "left", "no_wrap": False},
+                    ]
+
+                    for column in columns:
+                        table.add_column(
+                            column["name"],
+                            justify=column["justify"],
+                            no_wrap=column["no_wrap"],
+                        )
+
+                    for monitor in local.monitors.values():
+                        e = validate.enabled(monitor)
+                        m = validate.mustache(monitor)
+                        n = validate.channels(monitor, channels)
+                        destination = n[2].lower()
+                        o = "-", "-"
+                        s = "-", "-"
+                        if "slack" in destination:
+                            s = validate.slack(monitor)
+                            o = True, "-"
+                        if "opsgenie" in destination:
+                            if "heartbeat" not in destination:
+                                o = validate.opsgenie(monitor)
+                                s = True, "-"
+                            else:
+                                o = True, "-"
+                                s = True, "-"
+                        output.append(
+                            (
+                                monitor["monitor"]["name"],
+                                e[1],
+                                m[1],
+                                o[1],
+                                s[1],
+                                f"{n[1]} {n[2]}",
+                            )
+                        )
+
+                    output.sort(key=lambda row: row[0])
+                    for row in output:
+                        printable_errors = "\n".join(
+                            f"- {error}" for error in validate.errors.get(row[0], ())
+                        )
+
+                        table.add_row(*row, printable_errors)
+                    console.print(table)
 
-            if arg.alerts or arg.severity or arg.size or arg.state:
-                view = View(local.monitors, remote.monitors, arg, config)
-                print(f" - Showing alerting information.")
-                view.alerts(alerts, channels)
-
-            if arg.print:
-                do_print = True
-                if len(local.monitors) > 10:
-                    do_print = helper.confirm(
-                        f"Printing {len(local.monitors)} results, consider using the --filter"
-                        f" option to narrow down results.\nDo you want to continue?",
-                        "print",
+                if arg.info:
+                    view = View(local.monitors, remote.monitors, arg, config)
+                    compare.compare_monitors(
+                        local.monitors, remote.monitors, local.revision
                     )
-                if do_print == True:
-                    for id, content in local.monitors.items():
-                        print(
-                            f"-------- Printing monitor {content['monitor']['name']} --------"
+                    print(f" - Showing monitor information.")
+                    try:
+                        view.monitor_info(compare.monitor_diff, alerts, channels)
+                    except KeyError as e:
+                        util.error(
+                            "Notification channel not found - please validate monitors with --validate.",
+                            f"{e.__class__.__name__}: {e}",
+                        )
+
+                if arg.alerts or arg.severity or arg.size or arg.state:
+                    view = View(local.monitors, remote.monitors, arg, config)
+                    print(f" - Showing alerting information.")
+                    view.alerts(alerts, channels)
+
+                if arg.print:
+                    do_print = True
+                    if len(local.monitors) > 10:
+                        do_print = util.confirm(
+                            f"Printing {len(local.monitors)} results, consider using the --filter"
+                            f" option to narrow down results.\nDo you want to continue?",
+                            "print",
                         )
-                        if arg.print[0] == "json":
-                            print(json.dumps(content, indent=2))
-                        elif arg.print[0] == "yaml":
-                            print(yaml.dump(content))
-                        print("-" * (len(content["monitor"]["name"]) + 35))
-            if arg.run:
-                print(f"[bold]Running local monitors...[/bold]")
-                run_count = 0
-                for id, monitor in local.monitors.items():
-                    run_count += 1
-                    if (monitor["monitor"]["enabled"] == True) or (arg.force == True):
-                        run_results = remote.run_monitor(id)
+                    if do_print == True:
+                        for id, content in local.monitors.items():
+                            print(
+                                f"-------- Printing monitor {content['monitor']['name']} --------"
+                            )
+                            # Write monitor contents directly, bypassing rich markup and highlighting
+                            if arg.print[0] == "json":
+                                sys.stdout.write(json.dumps(content, indent=2))
+                                sys.stdout.write("\n")
+                            elif arg.print[0] == "yaml":
+                                yaml.dump(content, sys.stdout, Dumper=YamlDumper)
+                            print("-" * (len(content["monitor"]["name"]) + 35))
+                if arg.run:
+                    print(f"[bold]Running local monitors...[/bold]")
+                    run_count = 0
+                    run_ids = []
+                    for id, monitor in local.monitors.items():
+                        if (monitor["monitor"]["enabled"] == True) or (
+                            arg.force == True
+                        ):
+                            run_ids.append(id)
+                        else:
+                            print(
+                                f" - [yellow]Not running[/yellow] disabled monitor {monitor['monitor']['name']}. Use --force to run."
+                            )
+
+                    for id, run_results, run_error in remote.run_monitors(run_ids):
+                        monitor = local.monitors[id]
+                        run_count += 1
                         status = ""
                         if monitor["monitor"]["enabled"] != True:
                             status = " [yellow](disabled)[/yellow]"
-                        # print(run_results)
+                        if run_error:
+                            print(
+                                f" - {run_count} [red]Failed[/red] to run {monitor['monitor']['name']}{status}: {run_error}"
+                            )
+                            continue
                         print(
                             f" - {run_count} Ran {run_results['monitor_name']}{status}, searched last {((run_results['period_end'] - run_results['period_start']) / 1000) / 60} minutes: ",
                             end="",
@@ -340,55 +379,55 @@ and to validate monitors based on customizable validators."""
                         if arg.verbose:
                             print(f"   Full results for monitor id {id}:")
                             print(run_results)
-                    else:
-                        print(
-                            f" - [yellow]Not running[/yellow] disabled monitor {monitor['monitor']['name']}. Use --force to run."
-                        )
 
-            if arg.sync:
-                notify.add(
-                    f'Updates made to OpenSearch instance *{instance["name"]}*, running as user '
-                    f"`{remote.print_username()}`"
-                )
-                notify.add(type="divider")
-                print(
-                    f"[bold]Cleaning up local folders for folder / name mismatches...[/bold]"
-                )
-                # Run cleanup job on local folders
-                local.clean_folders()
-                if local.cleanup:
-                    for removed_dir, new_dir in local.cleanup.items():
-                        print(
-                            f" - Moved [cyan]{removed_dir}[/cyan] to [cyan]{new_dir}[/cyan]"
-                        )
-                    local.load_monitors()
-                else:
-                    print(" - [green]OK[/green]: No name mismatches found.")
-
-                # Check for duplicate and pathsafe names in remote monitors
-                duplicate_remote_names = []
-                for remote_id, remote_contents in remote.monitors.items():
-                    if remote_contents["monitor"]["name"] in duplicate_remote_names:
-                        helper.error(
-                            f"Duplicate names found in OpenSearch: {{remote_contents['monitor']['name']}}. This will cause local storage conflicts. "
-                            "Please remove the duplicate monitors."
-                        )
+                if arg.sync:
+                    do_notify = False
+                    notify.add(f"Aiven Monitor Manager", "header", "plain_text")
+                    notify.add(
+                        f'Updates made to OpenSearch instance *{instance["name"]}*, running as user '
+                        f"`{remote.print_username()}`"
+                    )
+                    notify.add(type="divider")
+                    print(
+                        f"[bold]Cleaning up local folders for folder / name mismatches...[/bold]"
+                    )
+                    # Run cleanup job on local folders. Moving folders does not change
+                    # monitor contents, so the loaded monitors stay valid.
+                    local.clean_folders()
+                    if local.cleanup:
+                        for removed_dir, new_dir in local.cleanup.items():
+                            print(
+                                f" - Moved [cyan]{removed_dir}[/cyan] to [cyan]{new_dir}[/cyan]"
+                            )
                     else:
-                        duplicate_remote_names.append(
-                            remote_contents["monitor"]["name"]
-                        )
+                        print(" - [green]OK[/green]: No name mismatches found.")
+
+                    # Check for duplicate and pathsafe names in remote monitors
+                    seen_remote_names = set()
+                    for remote_contents in remote.monitors.values():
+                        name = remote_contents["monitor"]["name"]
+                        if name in seen_remote_names:
+                            util.error(
+                                f"Duplicate names found in OpenSearch: {name}. This will cause local storage conflicts. "
+                                "Please remove the duplicate monitors."
+                            )
+                        else:
+                            seen_remote_names.add(name)
 
-                    if not helper.pathsafe(remote_contents["monitor"]["name"]):
-                        helper.error(
-                            f"File-path unsafe monitor name found in OpenSearch. Please rename the monitor.",
-                            f"'{remote_contents['monitor']['name']}'",
-                        )
+                        if not util.pathsafe(name):
+                            util.error(
+                                f"File-path unsafe monitor name found in OpenSearch. Please rename the monitor.",
+                                f"'{name}'",
+                            )
 
-                # Store new remote monitors
-                for monitor_id in remote.monitors:
-                    if monitor_id in local.monitors:
-                        continue
-                    else:
+                    new_remote_ids = remote.monitors.keys() - local.monitors.keys()
+                    new_local_ids = local.monitors.keys() - remote.monitors.keys()
+
+                    # Store new remote monitors
+                    remote_names = {}
+                    for id in new_remote_ids:
+                        remote_names[id] = remote.monitors[id]["monitor"]["name"]
+                    for monitor_id in sorted(new_remote_ids, key=remote_names.get):
                         local.store_monitor(monitor_id, remote.monitors[monitor_id])
                         # Add new remote monitors to local monitors
                         local.monitors[monitor_id] = remote.monitors[monitor_id]
@@ -396,124 +435,134 @@ and to validate monitors based on customizable validators."""
                             f" - Storing [cyan]{remote.monitors[monitor_id]['monitor']['name']}[/cyan]..."
                         )
 
-                # Create new local monitors
-                print(f"[bold]Searching for new local monitors...[/bold]")
-                created_new = False
-                skipped = []
-                for monitor_id in local.monitors:
-                    if monitor_id in remote.monitors:
-                        continue
-                    else:
+                    # Create new local monitors
+                    print(f"[bold]Searching for new local monitors...[/bold]")
+                    created_new = False
+                    local_names = {}
+                    for id in new_local_ids:
+                        local_names[id] = local.monitors[id]["monitor"]["name"]
+                    for monitor_id in sorted(new_local_ids, key=local_names.get):
                         print(
                             f" - New monitor found: {local.monitors[monitor_id]['monitor']['name']}"
                         )
-                        if helper.confirm(
-                            "Do you want to create a new remote monitor?"
-                        ):
+                        if util.confirm("Do you want to create a new remote monitor?"):
                             created_new = True
                             print(
                                 f" - Creating {local.monitors[monitor_id]['monitor']['name']}... ",
                                 end="",
                             )
                             new_id, new_contents = remote.create_monitor(
-                                helper.prepare_for_create(local.monitors[monitor_id])
+                                util.prepare_for_create(local.monitors[monitor_id])
                             )
                             print(f"created with ID {new_id}.")
                             local.store_monitor(new_id, new_contents)
+                            # Replace the temporary ID with the one assigned by OpenSearch
+                            del local.monitors[monitor_id]
+                            local.monitors[new_id] = new_contents
+                            remote.monitors[new_id] = new_contents
                             do_notify = True
                             notify.add(
                                 f"Created:\n```Name: {new_contents['monitor']['name']}\nMonitor ID: {new_id}\nType: "
                                 f"{new_contents['monitor']['monitor_type']}```"
                             )
                         else:
-                            skipped.append(monitor_id)
-                for id in skipped:
-                    del local.monitors[id]
+                            del local.monitors[monitor_id]
 
-                if created_new:
-                    local.load_monitors()
-                    remote.load_monitors()
-                else:
-                    print(" - [green]OK[/green]: No new monitors found.")
+                    if not created_new:
+                        print(" - [green]OK[/green]: No new monitors found.")
 
-                print("[bold]Checking for updated remote monitors...[/bold]")
-                # Check if remote monitors have higher versions than local monitors
-                compare.check_version_state(local.monitors, remote.monitors)
-                if compare.version_sync_mismatch:
-                    for id, info in compare.version_sync_mismatch.items():
-                        print(
-                            f" - Monitor {info[0]} remote version {info[1]} is newer than local version {info[2]}"
-                        )
-                        confirmation = helper.confirm(
-                            "Do you want to update local monitor? Updating will overwrite local changes.",
-                            "sync",
-                        )
-                        if confirmation:
+                    print("[bold]Checking for updated remote monitors...[/bold]")
+                    # Check if remote monitors have higher versions than local monitors
+                    compare.check_version_state(local.monitors, remote.monitors)
+                    if compare.version_sync_mismatch:
+                        for id, info in compare.version_sync_mismatch.items():
                             print(
-                                f" - Updating local version for {local.monitors[id]['monitor']['name']}"
+                                f" - Monitor {info[0]} remote version {info[1]} is newer than local version {info[2]}"
                             )
-                            local.store_monitor(id, remote.monitors[id])
-                        else:
-                            print(f" - Skipping {info[0]}...")
+                            confirmation = util.confirm(
+                                "Do you want to update local monitor? Updating will overwrite local changes.",
+                                "sync",
+                            )
+                            if confirmation:
+                                local_name = local.monitors[id]["monitor"]["name"]
+                                print(f" - Updating local version for {local_name}")
+                                # Remove the old folder if the monitor was renamed remotely
+                                if local_name != remote.monitors[id]["monitor"]["name"]:
+                                    local.remove_monitor(local_name)
+                                local.store_monitor(id, remote.monitors[id])
+                                local.monitors[id] = remote.monitors[id]
+                            else:
+                                print(f" - Skipping {info[0]}...")
+                    else:
+                        print(" - [green]OK[/green]: Monitor versions match.")
 
-                    local.load_monitors()
-                    local.clean_folders()
-                else:
-                    print(" - [green]OK[/green]: Monitor versions match.")
-
-                print("[bold]Checking local monitors for changes...[/bold]")
-                compare.compare_monitors(local.monitors, remote.monitors)
-                if compare.monitor_diff:
-                    diff_counter = 0
-                    for monitor_id, difference in compare.monitor_diff.items():
-                        diff_counter += 1
-                        print(
-                            f" - [{diff_counter}/{len(compare.monitor_diff)}] Found local changes in [bold]{local.monitors[monitor_id]['monitor']['name']}[/bold]:"
-                        )
-                        difference = json.loads(difference)
+                    print("[bold]Checking local monitors for changes...[/bold]")
+                    compare.compare_monitors(
+                        local.monitors, remote.monitors, local.revision
+                    )
+                    if compare.monitor_diff:
+                        diff_counter = 0
+                        diff_total = len(compare.monitor_diff)
+                        for monitor_id, difference in compare.monitor_diff.items():
+                            diff_counter += 1
+                            name = local.monitors[monitor_id]["monitor"]["name"]
+                            print(
+                                f" - [{diff_counter}/{diff_total}] Found local changes in [bold]{name}[/bold]:"
+                            )
+                            difference = json.loads(difference)
 
-                        # Parse differences to an easy-to-read format
-                        print_json(data=difference)
+                            # Parse differences to an easy-to-read format
+                            print_json(data=difference)
 
-                        confirmation = helper.confirm(
-                            "Do you want to update the remote monitor with these changes?",
-                            "monitor_update",
-                        )
-                        if confirmation:
-                            updated_id, updated_contents = remote.update_monitor(
-                                monitor_id, local.monitors[monitor_id]
-                            )
-                            local.store_monitor(updated_id, updated_contents)
-                            do_notify = True
-                            notify.add(
-                                f"Updated *{local.monitors[monitor_id]['monitor']['name']}*\n"
-                                f"```{json.dumps(difference, indent=2)}```"
+                            confirmation = util.confirm(
+                                "Do you want to update the remote monitor with these changes?",
+                                "monitor_update",
                             )
-                else:
-                    print(
-                        f" - [green]OK[/green]: No changes found, local and remote monitors match."
-                    )
-                notify.add(type="divider")
-                notify.add(f"Total monitors on instance: {len(remote.monitors)}")
-
-                print(f"[bold]Updating monitor README files...[/bold]")
-                meta = Metadata(config, instance, arg)
-                meta.generate(local.monitors, channels)
-                if meta.created:
-                    for item in meta.created:
+                            if confirmation:
+                                updated_id, updated_contents = remote.update_monitor(
+                                    monitor_id, local.monitors[monitor_id]
+                                )
+                                local.store_monitor(updated_id, updated_contents)
+                                do_notify = True
+                                notify.add(
+                                    f"Updated *{name}*\n"
+                                    f"```{json.dumps(difference, indent=2)}```"
+                                )
+                    else:
                         print(
-                            f" - Created template metadata.json for {local.monitors[item]['monitor']['name']}"
+                            f" - [green]OK[/green]: No changes found, local and remote monitors match."
                         )
+                    notify.add(type="divider")
+                    notify.add(f"Total monitors on instance: {len(remote.monitors)}")
+
+                    print(f"[bold]Updating monitor README files...[/bold]")
+                    meta = Metadata(config, instance, arg)
+                    meta.generate(local.monitors, channels)
+                    if meta.created:
+                        for item in meta.created:
+                            print(
+                                f" - Created template metadata.json for {local.monitors[item]['monitor']['name']}"
+                            )
+
+                    print(f" - [green]OK[/green]: Everything up to date.")
+
+                if need_remote:
+                    remote.close()
 
-                print(f" - [green]OK[/green]: Everything up to date.")
+            elif not instance["active"]:
+                continue
 
-        elif not instance["active"]:
-            continue
+            if instance_counter == 0:
+                util.error("No instances configured. Please review settings.json.")
+            if arg.sync:
+                # Only post when this instance changed, otherwise drop its summary blocks
+                if do_notify:
+                    notify.flush()
+                else:
+                    notify.clear()
+    except OpenSearchHTTPError as e:
+        util.error(e)
 
-        if instance_counter == 0:
-            helper.error("No instances configured. Please review settings.json.")
-        if do_notify:
-            notify.send()
     print(
         f"\n== All done, Aiven Monitor Manager exiting, took {round((time.time() - exec_start), 2)}s. =="
     )
@@ -1,6 +1,22 @@
+import hashlib
+import json
 from deepdiff import DeepDiff
 
 
+def _canon_hash(monitor):
+    """
+    Returns a digest of the canonical JSON form of a monitor, used to skip DeepDiff on unchanged monitors.
+
+    Args:
+        monitor (dict): The monitor contents.
+
+    Returns:
+        bytes: A 16-byte BLAKE2b digest of the monitor serialized with sorted keys.
+    """
+    canonical = json.dumps(monitor, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+
+
 class Comparator:
     """
     A class to compare OpenSearch monitors between two different JSON configurations.
@@ -14,9 +30,10 @@ class Comparator:
         version_sync_mismatch (dict): A dictionary to store monitor IDs and their respective version differences.
         name_sync_mismatch (list): A list to store monitor IDs that have name discrepancies.
         monitor_diff (dict): A dictionary to store differences between local and remote monitors.
+        compared_state (tuple): Identifies the monitors and local revision the current 'monitor_diff' was computed for.
 
     Methods:
-        compare_monitors(local_monitors, remote_monitors): Compares all monitors and identifies changes.
+        compare_monitors(local_monitors, remote_monitors, revision=None): Compares all monitors and identifies changes.
         check_version_state(local_monitors, remote_monitors): Checks for version synchronization mismatches between
           local and remote monitors.
         check_name_state(local_monitors, remote_monitors): Identifies monitors that have different names in local and
@@ -34,43 +51,60 @@ class Comparator:
         self.version_sync_mismatch = {}
         self.name_sync_mismatch = []
         self.monitor_diff = {}
+        self.compared_state = None
 
-    def compare_monitors(self, local_monitors, remote_monitors):
+    def compare_monitors(self, local_monitors, remote_monitors, revision=None):
         """
         Compares all monitors between local and remote configurations for changes and stores the differences.
 
         This method compares the 'monitor' field of each monitor in the local and remote configurations using DeepDiff.
-         Differences are stored in the 'monitor_diff' attribute.
+         Differences are stored in the 'monitor_diff' attribute. Monitors with identical canonical hashes are skipped
+         without running DeepDiff, as most monitors are unchanged between runs.
+
+        If a revision is given and neither the monitors nor the revision have changed since the previous call, the
+         previous differences are kept and the comparison is skipped.
 
         Args:
             local_monitors (dict): A dictionary containing the local monitors with their IDs as keys.
             remote_monitors (dict): A dictionary containing the remote monitors with their IDs as keys.
+            revision (int, optional): The revision of the local monitors, incremented whenever they are modified.
         """
+        state = (id(local_monitors), id(remote_monitors), revision)
+        if revision is not None and state == self.compared_state:
+            return
+        self.monitor_diff = {}
         for monitor_id, contents in local_monitors.items():
             local_contents = contents["monitor"]
             remote_contents = remote_monitors[monitor_id]["monitor"]
+            if _canon_hash(local_contents) == _canon_hash(remote_contents):
+                continue
             result = DeepDiff(remote_contents, local_contents, view="tree")
             if result:
                 self.monitor_diff[monitor_id] = result.to_json()
+        self.compared_state = state
 
     def check_version_state(self, local_monitors, remote_monitors):
         """
         Checks for version synchronization mismatches between local and remote monitors.
 
-        This method compares the '_version' field of each monitor in the local and remote configurations. If the local
-        version is older, it records the monitor ID along with both versions in the 'version_sync_mismatch' attribute.
+        This method compares the '_version' field of each monitor present in both the local and remote configurations.
+        If the local version is older, it records the monitor ID along with both versions in the 'version_sync_mismatch'
+        attribute.
 
         Args:
             local_monitors (dict): A dictionary containing the local monitors with their IDs as keys.
             remote_monitors (dict): A dictionary containing the remote monitors with their IDs as keys.
         """
-        for id, remote_version in remote_monitors.items():
-            local_version = local_monitors[id]
-            if int(local_version["_version"]) < int(remote_version["_version"]):
+        for id, remote_contents in remote_monitors.items():
+            if id not in local_monitors:
+                continue
+            local_version = local_monitors[id]["_version"]
+            remote_version = remote_contents["_version"]
+            if local_version < remote_version:
                 self.version_sync_mismatch[id] = [
-                    local_version["monitor"]["name"],
-                    remote_version["_version"],
-                    local_version["_version"],
+                    local_monitors[id]["monitor"]["name"],
+                    remote_version,
+                    local_version,
                 ]
 
     def check_name_state(self, local_monitors, remote_monitors):
@@ -1,5 +1,5 @@
 import json
-from os import path, getenv, listdir
+from os import path, getenv, scandir
 from module.helpers import helper
 from rich import print
 
@@ -51,34 +51,29 @@ class Configuration:
              characters or starts with a space, or if other critical errors occur.
         """
         if path.isfile(self.config_file):
-            with open(self.config_file, "r") as config_file:
-                try:
+            try:
+                with open(self.config_file, "r") as config_file:
                     self.config = json.loads(config_file.read())
-                    self.config["global"][
-                        "monitor root path"
-                    ] = f"{path.realpath(path.dirname(__file__))}/../../monitors/"
-                    if self.config["global"]["slack webhook"]:
-                        if self.config["global"]["slack webhook"][0:8] != "https://":
-                            slack_env_var = self.config["global"][
-                                "slack webhook"
-                            ].upper()
-                            self.config["global"]["slack webhook"] = getenv(
-                                slack_env_var
-                            )
-                            if self.config["global"]["slack webhook"] == None:
-                                self.helper.error(
-                                    f"Slack webhook configured but can not find environment variable {slack_env_var}"
-                                )
-                        else:
-                            pass
-
-                except json.decoder.JSONDecodeError as e:
-                    self.helper.error(
-                        f"Can not parse JSON: {self.config_file}. Fix the file structure or delete the file and run command again to create a template.",
-                        e,
-                    )
-                    print(f"Parse error: {e}")
-                    exit(1)
+                global_config = self.config["global"]
+                global_config["monitor root path"] = (
+                    f"{path.realpath(path.dirname(__file__))}/../../monitors/"
+                )
+                slack_webhook = global_config["slack webhook"]
+                if slack_webhook and not slack_webhook.startswith("https://"):
+                    slack_env_var = slack_webhook.upper()
+                    global_config["slack webhook"] = getenv(slack_env_var)
+                    if global_config["slack webhook"] is None:
+                        self.helper.error(
+                            f"Slack webhook configured but can not find environment variable {slack_env_var}"
+                        )
+
+            except json.decoder.JSONDecodeError as e:
+                self.helper.error(
+                    f"Can not parse JSON: {self.config_file}. Fix the file structure or delete the file and run command again to create a template.",
+                    e,
+                )
+                print(f"Parse error: {e}")
+                exit(1)
             for instance in self.config["instances"]["opensearch"]:
                 for key, value in instance.items():
                     if key == "name":
@@ -87,7 +82,7 @@ class Configuration:
                                 f'Aborting! Path-unsafe characters in instance name "{value}". Not allowed: {self.unsafe_characters}'
                             )
                             exit(1)
-            return dict(self.config)
+            return self.config
         else:
             self.create_config()
             self.helper.error(
@@ -109,6 +104,8 @@ class Configuration:
         """
         self.config["global"] = {}
         self.config["global"]["slack webhook"] = ""
+        self.config["global"]["run_concurrency"] = 8
+        self.config["global"]["channel_cache_ttl"] = 0
         self.config["global"]["metadata_template_attributes"] = [
             "MITRE technique",
             "MITRE Tactic",
@@ -121,15 +118,17 @@ class Configuration:
         ]
         self.config["instances"] = {}
         self.config["instances"]["opensearch"] = []
-        existing_instances = listdir(
+        # Skip hidden entries before checking the entry type
+        with scandir(
             f"{path.realpath(path.dirname(__file__))}/../../monitors/"
-        )
-        for entry in existing_instances:
-            if entry[0:1] == ".":
-                existing_instances.remove(entry)
+        ) as entries:
+            existing_instances = [
+                entry.name
+                for entry in entries
+                if not entry.name.startswith(".") and entry.is_dir()
+            ]
         if len(existing_instances) > 0:
             for instance in existing_instances:
-                print("a")
                 self.config["instances"]["opensearch"].append(
                     {
                         "active": False,
@@ -1,6 +1,47 @@
+import functools
+import re
 from rich import print
 from datetime import datetime
 
+UNSAFE_PATH_CHARACTERS = re.compile(r'[\\/:*?"<>|]')
+TRIGGER_LEVELS = ("query_level_trigger", "document_level_trigger")
+
+
+def iter_actions(monitor):
+    """
+    Yields every action of a monitor together with the trigger and trigger level it belongs to.
+
+    Triggers are visited in order, and for each trigger the query level actions come before the document level
+    actions. Triggers without actions on a level are skipped.
+
+    Args:
+        monitor (dict): The monitor configuration, without the surrounding '_id' and '_version' fields.
+
+    Yields:
+        tuple: The trigger (dict), the trigger level (str) and the action (dict).
+    """
+    for trigger in monitor["triggers"]:
+        for level in TRIGGER_LEVELS:
+            trigger_content = trigger.get(level)
+            if not trigger_content:
+                continue
+            for action in trigger_content.get("actions", ()):
+                yield trigger, level, action
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_timestamp(timestamp):
+    """
+    Converts a UNIX timestamp in milliseconds to a local date and time string, caching repeated timestamps.
+
+    Args:
+        timestamp (int or str): The UNIX timestamp in milliseconds.
+
+    Returns:
+        str: The date and time in 'YYYY-MM-DD HH:MM:SS' format.
+    """
+    return str(datetime.fromtimestamp(int(timestamp) // 1000))
+
 
 class helper:
     """
@@ -17,6 +58,8 @@ class helper:
         pathsafe(s): Checks if a string is safe to be used as a path.
         timestamp_to_string(timestamp): Converts a timestamp to a human-readable string.
         prepare_for_create(monitor): Prepares a monitor configuration for creation, removing unnecessary fields.
+        split_filter(filter): Splits a comma-separated filter argument into its terms.
+        compile_filter(filter): Compiles comma-separated filter terms into a case-insensitive matcher.
     """
 
     def __init__(self, arg):
@@ -99,13 +142,9 @@ class helper:
         Returns:
             bool: True if the string is safe to use as a path, otherwise False.
         """
-        unsafe_chars = ["\\", "/", ":", "*", "?", '"', "<", ">", "|"]
         if s and s[0] == " ":
             return False
-        for char in s:
-            if char in unsafe_chars:
-                return False
-        return True
+        return UNSAFE_PATH_CHARACTERS.search(s) is None
 
     def timestamp_to_string(self, timestamp):
         """
@@ -118,7 +157,7 @@ class helper:
             str: The human-readable string representation of the timestamp, or '-' if the timestamp is None.
         """
         if timestamp is not None:
-            return f"{str(datetime.fromtimestamp(int(str(timestamp)[:-3])))}"
+            return _format_timestamp(timestamp)
         else:
             return "-"
 
@@ -140,25 +179,45 @@ class helper:
             self.error(
                 f"Monitor name {content['name']} is not filepath safe. Please rename the monitor."
             )
-        remove_keys = ["enabled_time", "last_update_time", "data_sources", "owner"]
-        for key in remove_keys:
-            try:
-                del content[key]
-            except KeyError:
-                continue
-        try:
-            for trigger in content["triggers"]:
-                del trigger["document_level_trigger"]["id"]
-                for action in trigger["document_level_trigger"]["actions"]:
-                    del action["id"]
-        except KeyError:
-            pass
-
-        try:
-            for trigger in content["triggers"]:
-                del trigger["query_level_trigger"]["id"]
-                for action in trigger["query_level_trigger"]["actions"]:
-                    del action["id"]
-        except KeyError:
-            pass
+        for key in ("enabled_time", "last_update_time", "data_sources", "owner"):
+            content.pop(key, None)
+        for trigger in content.get("triggers", ()):
+            for trigger_type in ("document_level_trigger", "query_level_trigger"):
+                trigger_content = trigger.get(trigger_type)
+                if not trigger_content:
+                    continue
+                trigger_content.pop("id", None)
+                for action in trigger_content.get("actions", ()):
+                    action.pop("id", None)
         return content
+
+    def split_filter(self, filter):
+        """
+        Splits a comma-separated filter argument into its terms.
+
+        Args:
+            filter (str): One or more comma-separated terms to match in monitor names.
+
+        Returns:
+            list: The non-empty, whitespace-stripped terms, or an empty list if no filter was given.
+        """
+        if not filter:
+            return []
+        return [term.strip() for term in filter.split(",") if term.strip()]
+
+    def compile_filter(self, filter):
+        """
+        Compiles a comma-separated list of filter terms into a single case-insensitive pattern.
+
+        All terms are matched in one pass over the monitor name, so adding terms does not add a scan per term.
+
+        Args:
+            filter (str): One or more comma-separated terms to match in monitor names.
+
+        Returns:
+            re.Pattern: A compiled pattern matching any of the terms, or None if no terms were given.
+        """
+        terms = self.split_filter(filter)
+        if not terms:
+            return None
+        return re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
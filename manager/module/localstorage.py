@@ -1,9 +1,12 @@
 import json
-import random
-import string
-from os import makedirs, listdir, rmdir, remove, path
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+from os import makedirs, listdir, rmdir, remove, scandir, stat
 from module.helpers import helper
 
+FORBIDDEN_NAME_CHARACTERS = ", ".join(["\\", "/", ":", "*", "?", '"', "<", ">", "|"])
+MONITOR_FILES = ("monitor.json", "metadata.json", "README.md")
+
 
 class ManageLocalMonitors:
     """
@@ -20,12 +23,18 @@ class ManageLocalMonitors:
         instance_path (str): The file path to the instance's monitor directory.
         monitors (dict): A dictionary to store monitor information.
         cleanup (dict): A dictionary to track cleanup operations.
+        monitor_cache (dict): The monitors parsed by the last load with their file modification time and size, reused
+          by clean_folders.
+        revision (int): A counter incremented whenever monitors are loaded, stored or removed.
 
     Methods:
         clean_folders(): Renames local folders to match monitor names and removes mismatches.
         store_monitor(monitor_id, monitor_contents, metadata={}): Stores an individual monitor's data in a file.
         remove_monitor(monitor_name): Removes a monitor from the system.
         load_monitors(): Retrieves all stored monitors in the instance subfolder.
+        read_monitor_file(monitor_dir): Reads and parses a single monitor file.
+        list_directories(): Lists the monitor directories in the instance subfolder.
+        cache_valid(cached, file_stat): Checks whether a cached monitor matches its file.
     """
 
     def __init__(self, config, instance, arg):
@@ -41,12 +50,13 @@ class ManageLocalMonitors:
         self.config = config
         self.instance_name = instance["name"]
         self.arg = arg
-        self.helper = helper(arg)
         self.instance_path = (
             f"{self.config['global']['monitor root path']}{self.instance_name}/"
         )
         self.monitors = {}
         self.cleanup = {}
+        self.monitor_cache = {}
+        self.revision = 0
 
     def clean_folders(self):
         """
@@ -65,41 +75,38 @@ class ManageLocalMonitors:
                 makedirs(f"{self.instance_path}")
             except FileExistsError:
                 pass
-            directories = [
-                x for x in listdir(f"{self.instance_path}") if not x.startswith(".")
-            ]  # remove dotfiles
-
-            for monitor_dir in directories:
-                # Skip files in root directory
-                if path.isfile(f"{self.instance_path}{monitor_dir}"):
-                    continue
+            for monitor_dir in self.list_directories():
+                monitor_file = f"{self.instance_path}{monitor_dir}/monitor.json"
                 try:
-                    with open(
-                        f"{self.instance_path}{monitor_dir}/monitor.json", "r"
-                    ) as contents:
-                        try:
-                            monitor = json.loads(contents.read())
-                        except Exception as e:
-                            self.helper.error(
-                                f"File '{monitor_dir}/monitor.json' contains errors.",
-                                f"{e.__class__.__name__}: {e}",
-                            )
+                    file_stat = stat(monitor_file)
+                    cached = self.monitor_cache.get(monitor_dir)
+                    if self.cache_valid(cached, file_stat):
+                        monitor = cached["monitor"]
+                    else:
+                        with open(monitor_file, "rb") as contents:
+                            try:
+                                monitor = json.loads(contents.read())
+                            except Exception as e:
+                                self.helper.error(
+                                    f"File '{monitor_dir}/monitor.json' contains errors.",
+                                    f"{e.__class__.__name__}: {e}",
+                                )
                 except FileNotFoundError:
-                    list = listdir(f"{self.instance_path}{monitor_dir}")
-                    if not list:
+                    with scandir(f"{self.instance_path}{monitor_dir}") as entries:
+                        empty = next(entries, None) is None
+                    if empty:
                         rmdir(f"{self.instance_path}{monitor_dir}")
                         continue
                     else:
                         self.helper.error(
                             f"File monitor.json missing, but directory {monitor_dir} is not empty. Please manually remove the files to re-sync local monitor.",
-                            f"Files in directory: {list}",
+                            f"Files in directory: {listdir(f'{self.instance_path}{monitor_dir}')}",
                         )
                 if self.helper.pathsafe(monitor["monitor"]["name"]):
                     pass
                 else:
-                    badchars = ", ".join(["\\", "/", ":", "*", "?", '"', "<", ">", "|"])
                     self.helper.error(
-                        f"Monitor name '{monitor['monitor']['name']}' contains forbidden characters ({badchars}). Please rename the monitor before continuing."
+                        f"Monitor name '{monitor['monitor']['name']}' contains forbidden characters ({FORBIDDEN_NAME_CHARACTERS}). Please rename the monitor before continuing."
                     )
 
                 if monitor_dir != monitor["monitor"]["name"]:
@@ -139,6 +146,7 @@ class ManageLocalMonitors:
             bool: True if the monitor was stored successfully, False otherwise.
         """
 
+        self.revision += 1
         monitor_name = monitor_contents["monitor"]["name"]
         monitor_path = f"{self.instance_path}{monitor_name}/"
 
@@ -150,12 +158,10 @@ class ManageLocalMonitors:
             except FileExistsError:
                 pass
             with open(f"{monitor_path}monitor.json", "w") as output_file:
-                output_file.write(json.dumps(monitor_contents, indent=2))
-                output_file.write("\n")
+                output_file.write(f"{json.dumps(monitor_contents, indent=2)}\n")
             if metadata:
                 with open(f"{monitor_path}metadata.json", "w") as output_file:
-                    output_file.write(json.dumps(metadata, indent=2))
-                    output_file.write("\n")
+                    output_file.write(f"{json.dumps(metadata, indent=2)}\n")
             return True
 
     def remove_monitor(self, monitor_name):
@@ -173,11 +179,11 @@ class ManageLocalMonitors:
             None
         """
 
+        self.revision += 1
         if self.arg.dryrun:
             return True
         else:
-            files_to_remove = ["monitor.json", "metadata.json", "README.md"]
-            for file in files_to_remove:
+            for file in MONITOR_FILES:
                 try:
                     remove(f"{self.instance_path}{monitor_name}/{file}")
                 except FileNotFoundError:
@@ -190,55 +196,52 @@ class ManageLocalMonitors:
         Loads all monitors from the instance subfolder into a dictionary for management and filtering.
 
         This method reads monitor data from local directories, handles JSON decoding, and manages monitor versions.
+        The '_version' field is coerced to an integer so comparisons against remote versions are always numeric.
 
         Returns:
             dict: A dictionary containing all stored monitors, where the keys are monitor IDs and the values are monitor objects.
         """
+        self.revision += 1
         try:
             makedirs(f"{self.instance_path}")
         except FileExistsError:
             pass
         all_monitors = {}
-        directories = []
-        files = []
-        dirlist = [
-            x for x in listdir(f"{self.instance_path}") if not x.startswith(".")
-        ]  # remove dotfiles
-
-        for item in dirlist:
-            full_path = f"{self.instance_path}{item}"
-            if path.isdir(full_path):
-                directories.append(item)
-            elif path.isfile(full_path):
-                files.append(full_path)
-            else:
-                pass
 
-        for monitor_dir in directories:
+        monitor_cache = {}
+        monitor_dirs = []
+        monitor_stats = []
+        for monitor_dir in self.list_directories():
             try:
-                with open(
-                    f"{self.instance_path}{monitor_dir}/monitor.json", "r"
-                ) as contents:
-                    try:
-                        monitor = json.loads(contents.read())
-                    except Exception as e:
-                        self.helper.error(
-                            f"JSON decode error: Can not load monitor from '{self.instance_path}{monitor_dir}/monitor.json'",
-                            e,
-                        )
-                    if not "_id" in monitor:
-                        self.helper.error(
-                            "Parsing error: No '_id' found in new monitor."
-                        )
-                    if monitor["_id"]:
-                        monitor_id = monitor["_id"]
-                    else:
-                        monitor_id = "create" + "".join(
-                            random.choice(string.ascii_lowercase) for i in range(10)
-                        )
-                    contents.close()
+                file_stat = stat(f"{self.instance_path}{monitor_dir}/monitor.json")
             except FileNotFoundError:
                 continue
+            monitor_dirs.append(monitor_dir)
+            monitor_stats.append(file_stat)
+
+        if monitor_dirs:
+            with ThreadPoolExecutor(max_workers=min(32, len(monitor_dirs))) as executor:
+                parsed = list(executor.map(self.read_monitor_file, monitor_dirs))
+            for monitor_dir, file_stat, monitor in zip(
+                monitor_dirs, monitor_stats, parsed
+            ):
+                if monitor is not None:
+                    monitor_cache[monitor_dir] = {
+                        "mtime": file_stat.st_mtime_ns,
+                        "size": file_stat.st_size,
+                        "monitor": monitor,
+                    }
+
+        for monitor_dir, cached in monitor_cache.items():
+            monitor = cached["monitor"]
+            if not "_id" in monitor:
+                self.helper.error("Parsing error: No '_id' found in new monitor.")
+            if "_version" in monitor:
+                monitor["_version"] = int(monitor["_version"])
+            if monitor["_id"]:
+                monitor_id = monitor["_id"]
+            else:
+                monitor_id = f"create{secrets.token_hex(5)}"
 
             if monitor_id in all_monitors:
                 if monitor["_version"] > all_monitors[monitor_id]["_version"]:
@@ -249,11 +252,72 @@ class ManageLocalMonitors:
             else:
                 all_monitors[monitor_id] = monitor
 
+        self.monitor_cache = monitor_cache
+
         if self.config["filter"]:
             filtered_monitors = {}
             for id, monitor in all_monitors.items():
-                if self.config["filter"].lower() in monitor["monitor"]["name"].lower():
+                if self.config["filter"].search(monitor["monitor"]["name"]):
                     filtered_monitors[id] = monitor
             self.monitors = filtered_monitors
         else:
             self.monitors = all_monitors
+
+    def read_monitor_file(self, monitor_dir):
+        """
+        Reads and parses the monitor.json file of a single monitor directory.
+
+        Called from a thread pool by load_monitors, so independent monitor files are read concurrently.
+
+        Args:
+            monitor_dir (str): The name of the monitor directory in the instance subfolder.
+
+        Returns:
+            dict: The parsed monitor, or None if the monitor file was removed before it could be read.
+        """
+        monitor_file = f"{self.instance_path}{monitor_dir}/monitor.json"
+        try:
+            with open(monitor_file, "rb") as contents:
+                try:
+                    return json.loads(contents.read())
+                except Exception as e:
+                    self.helper.error(
+                        f"JSON decode error: Can not load monitor from '{monitor_file}'",
+                        e,
+                    )
+        except FileNotFoundError:
+            return None
+
+    def list_directories(self):
+        """
+        Lists the monitor directories in the instance subfolder with a single directory scan.
+
+        Dotfiles and files in the instance subfolder are skipped. File types are read from the directory entries, so
+        no additional stat calls are needed.
+
+        Returns:
+            list: The names of the monitor directories.
+        """
+        with scandir(self.instance_path) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if not entry.name.startswith(".") and entry.is_dir()
+            ]
+
+    def cache_valid(self, cached, file_stat):
+        """
+        Checks whether a cached monitor still matches its monitor.json file.
+
+        Args:
+            cached (dict): The cache entry of the monitor directory, or None if it is not cached.
+            file_stat (os.stat_result): The result of stat() on the monitor.json file.
+
+        Returns:
+            bool: True if the cached monitor can be used instead of reading the file, otherwise False.
+        """
+        return bool(
+            cached
+            and cached["mtime"] == file_stat.st_mtime_ns
+            and cached["size"] == file_stat.st_size
+        )
@@ -1,6 +1,61 @@
+import functools
 import json
-from os import path
-from module.helpers import helper
+from concurrent.futures import ThreadPoolExecutor
+from module.helpers import helper, TRIGGER_LEVELS
+from rich import print
+
+SEVERITY_BADGES = {
+    1: '![critical badge](https://img.shields.io/badge/P1-CRITICAL-red "Critical") ',
+    2: '![high badge](https://img.shields.io/badge/P2-HIGH-orange "High") ',
+    3: '![medium badge](https://img.shields.io/badge/P3-MEDIUM-yellow "Medium") ',
+    4: '![low badge](https://img.shields.io/badge/P4-LOW-yellow "Low") ',
+    5: '![info  badge](https://img.shields.io/badge/P5-INFO-blue "Info") ',
+}
+STATUS_BADGES = {
+    True: "![Status: Enabled](https://img.shields.io/badge/status-enabled-green)\n",
+    False: "![Status: Disabled](https://img.shields.io/badge/status-disabled-red)\n",
+}
+STATUS_BADGE_UNKNOWN = (
+    "![Status: Unknown](https://img.shields.io/badge/status-unknown-yellow)\n"
+)
+METADATA_KEYS = ("description", "author", "attributes", "references")
+MITRE_PATHS = {
+    "MITRE Tactic": "tactics",
+    "MITRE Technique": "techniques",
+    "MITRE Data Source": "datasources",
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _mitre_id_path(value):
+    """
+    Converts a MITRE attribute value into the ID path used in attack.mitre.org URLs.
+
+    The same techniques and tactics recur across many monitors, so the conversions are cached.
+
+    Args:
+        value (str): The attribute value, starting with a MITRE ID such as "T1059.001".
+
+    Returns:
+        str: The MITRE ID with sub-technique dots replaced by slashes, for example "T1059/001".
+    """
+    return value.split(" ", 1)[0].replace(".", "/")
+
+
+def _severity_badge(severity):
+    """
+    Returns the README badge for a trigger severity.
+
+    Args:
+        severity (str): The trigger severity, normally "1" to "5".
+
+    Returns:
+        str: The severity badge, or the severity itself if it is not a known severity level.
+    """
+    try:
+        return SEVERITY_BADGES[int(severity)]
+    except (KeyError, TypeError, ValueError):
+        return f"{severity} "
 
 
 class Metadata:
@@ -22,7 +77,9 @@ class Metadata:
 
     Methods:
         generate(all_monitors, channels): Generates missing metadata for all monitors.
+        generate_monitor(id, monitor, channels): Generates missing metadata for a single monitor.
         write_readme(monitor, metadata, channels): Writes a README file for a monitor based on its metadata.
+        attribute_row(key, value, references): Formats an attribute value as a README table row.
         create_json(monitor, force=False): Creates a metadata JSON file for a monitor.
         read_json(monitor): Reads the metadata JSON file for a monitor and stores its contents.
     """
@@ -40,7 +97,6 @@ class Metadata:
         self.config = config
         self.arg = arg
         self.instance = instance
-        self.helper = helper(arg)
         self.instance_path = (
             f"{self.config['global']['monitor root path']}{self.instance['name']}/"
         )
@@ -51,21 +107,55 @@ class Metadata:
         """
         Generates missing metadata for all monitors and writes README files.
 
-        This method iterates through all monitors, generates metadata JSON files if they are missing, reads existing
-        metadata, and writes README files based on the metadata and monitor configuration.
+        Monitors are processed concurrently in a thread pool, as each monitor only touches files in its own
+        directory. Newly created metadata is recorded in the original monitor order.
 
         Args:
             all_monitors (dict): A dictionary containing all monitors.
             channels (list): A list containing channels information.
         """
-        for id, monitor in all_monitors.items():
-            if self.create_json(monitor, force=False):
-                self.created.append(id)
+        # Dry runs neither create, read nor write metadata, so there is nothing to generate
+        if self.arg.dryrun or not all_monitors:
+            return
+        with ThreadPoolExecutor(max_workers=min(32, len(all_monitors))) as executor:
+            results = executor.map(
+                lambda item: self.generate_monitor(*item, channels),
+                all_monitors.items(),
+            )
+            for id, created in zip(all_monitors, results):
+                if created:
+                    self.created.append(id)
+
+    def generate_monitor(self, id, monitor, channels):
+        """
+        Generates missing metadata for a single monitor and writes its README file.
+
+        This method generates the metadata JSON file if it is missing, reads existing metadata, and writes the README
+        file based on the metadata and monitor configuration. The README is skipped when the monitor has no metadata,
+        or its metadata lacks one of the keys the README is built from.
+
+        Args:
+            id (str): The ID of the monitor.
+            monitor (dict): The monitor configuration.
+            channels (list): A list containing channels information.
+
+        Returns:
+            bool: True if the metadata JSON file was created, otherwise False.
+        """
+        created = self.create_json(monitor, force=False)
+        if not created:
             self.read_json(monitor)
-            try:
-                self.write_readme(monitor, self.monitor_metadata[id], channels)
-            except KeyError:
-                pass
+        if id not in self.monitor_metadata:
+            return created
+        metadata = self.monitor_metadata[id]
+        missing = [key for key in METADATA_KEYS if key not in metadata]
+        if missing:
+            print(
+                f" - [yellow]Skipping README for {monitor['monitor']['name']}[/yellow], metadata.json is missing: {', '.join(missing)}"
+            )
+            return created
+        self.write_readme(monitor, metadata, channels)
+        return created
 
     def write_readme(self, monitor, metadata, channels):
         """
@@ -85,102 +175,110 @@ class Metadata:
         if self.arg.dryrun:
             return True
         else:
-            monitor_name = monitor["monitor"]["name"]
+            content = monitor["monitor"]
+            monitor_name = content["name"]
             monitor_path = f"{self.instance_path}{monitor_name}/"
-            severity_map = {
-                1: "Critical",
-                2: "High",
-                3: "Medium",
-                4: "Low",
-                5: "Info",
-            }
-            severity_badges = {
-                1: '![critical badge](https://img.shields.io/badge/P1-CRITICAL-red "Critical") ',
-                2: '![high badge](https://img.shields.io/badge/P2-HIGH-orange "High") ',
-                3: '![medium badge](https://img.shields.io/badge/P3-MEDIUM-yellow "Medium") ',
-                4: '![low badge](https://img.shields.io/badge/P4-LOW-yellow "Low") ',
-                5: '![info  badge](https://img.shields.io/badge/P5-INFO-blue "Info") ',
-            }
-            readme = ""
-            readme += f"# {monitor['monitor']['name']} (ver. {monitor['_version']})\n"
-            if monitor["monitor"]["enabled"] == True:
-                readme += "![Status: Enabled](https://img.shields.io/badge/status-enabled-green)\n"
-            elif monitor["monitor"]["enabled"] == False:
-                readme += "![Status: Disabled](https://img.shields.io/badge/status-disabled-red)\n"
-            else:
-                readme += "![Status: Unknown](https://img.shields.io/badge/status-unknown-yellow)\n"
-
-            readme += f"## Description\n\n> {metadata['description']}\n\n"
-
-            try:
-                for input in monitor["monitor"]["inputs"]:
-                    index_list = []
-                    for index in input["search"]["indices"]:
-                        index_list.append(index)
-                    readme += f"Search indexes: `{', '.join(index_list)}`\n"
-            except KeyError:
-                pass
-
-            readme += f"\n**Author**: {metadata['author']}\n"
-            try:
-                readme += f"\n**Schedule**: `{monitor['monitor']['schedule']}`\n"
-            except Exception:
-                pass
-
-            readme += f"## Triggers\n\n"
+            readme = []
+            readme.append(f"# {monitor_name} (ver. {monitor['_version']})\n")
+            readme.append(
+                STATUS_BADGES.get(content.get("enabled"), STATUS_BADGE_UNKNOWN)
+            )
 
-            for trigger in monitor["monitor"]["triggers"]:
-                readme += "| Trigger | Severity |  Action --> Destination |\n"
-                readme += "| :------ | :------- | :---------- |\n"
-                readme += f"| {trigger['query_level_trigger']['name']} | {severity_badges[int(trigger['query_level_trigger']['severity'])]} | "
-                for action in trigger["query_level_trigger"]["actions"]:
+            readme.append(f"## Description\n\n> {metadata['description']}\n\n")
+
+            for input in content.get("inputs", ()):
+                indices = input.get("search", {}).get("indices")
+                if indices:
+                    readme.append(f"Search indexes: `{', '.join(indices)}`\n")
+
+            readme.append(f"\n**Author**: {metadata['author']}\n")
+            if "schedule" in content:
+                readme.append(f"\n**Schedule**: `{content['schedule']}`\n")
+
+            readme.append(f"## Triggers\n\n")
+
+            for trigger in content["triggers"]:
+                for level in TRIGGER_LEVELS:
+                    if level in trigger:
+                        trigger_content = trigger[level]
+                        break
+                else:
+                    continue
+                readme.append("| Trigger | Severity |  Action --> Destination |\n")
+                readme.append("| :------ | :------- | :---------- |\n")
+                readme.append(
+                    f"| {trigger_content['name']} | {_severity_badge(trigger_content['severity'])} | "
+                )
+                for action in trigger_content["actions"]:
                     template = str(action["message_template"]["source"])
                     try:
-                        readme += f"{action['name']} --> {channels[action['destination_id']]}<br>"
-                    except KeyError:
-                        readme += f"{action['name']} --> Unknown destination ID {action['destination_id']}<br>"
-                    readme += "|\n"
-                    readme += "\n```\n" + template.replace("\\n", "\n") + "\n```\n\n"
-
-            readme += f"## Attributes\n\n"
-            readme += "| Attribute | Value |\n" "|-----------|-------|\n"
-            for key, value in metadata["attributes"].items():
-                if type(value) != list:
-                    value = [value]
-                for value in value:
-                    if key == "MITRE Technique" and value != "not defined":
-                        metadata["references"].append(
-                            f"[{key} {value}](https://attack.mitre.org/techniques/{value.split(' ', 1)[0].replace('.', '/')}/)"
+                        readme.append(
+                            f"{action['name']} --> {channels[action['destination_id']]}<br>"
                         )
-                    if key == "MITRE Tactic" and value != "not defined":
-                        metadata["references"].append(
-                            f"[{key} {value}](https://attack.mitre.org/tactics/{value.split(' ', 1)[0].replace('.', '/')}/)"
+                    except KeyError:
+                        readme.append(
+                            f"{action['name']} --> Unknown destination ID {action['destination_id']}<br>"
                         )
-                    if key == "MITRE Data Source" and value != "not defined":
-                        metadata["references"].append(
-                            f"[{key} {value}](https://attack.mitre.org/datasources/{value.split(' ', 1)[0].replace('.', '/')}/)"
+                    readme.append("|\n")
+                    readme.append(
+                        "\n```\n" + template.replace("\\n", "\n") + "\n```\n\n"
+                    )
+
+            readme.append(f"## Attributes\n\n")
+            readme.append("| Attribute | Value |\n" "|-----------|-------|\n")
+            for key, values in metadata["attributes"].items():
+                if isinstance(values, list):
+                    for value in values:
+                        readme.append(
+                            self.attribute_row(key, value, metadata["references"])
                         )
-                    readme += f"| {key} | {value} |\n"
-            readme += "\n"
-            readme += "## References\n"
-            ref_counter = 0
-            for reference in metadata["references"]:
-                ref_counter += 1
-                readme += f"> {ref_counter}: {reference}  \n"
+                else:
+                    readme.append(
+                        self.attribute_row(key, values, metadata["references"])
+                    )
+            readme.append("\n")
+            readme.append("## References\n")
+            readme.extend(
+                f"> {ref_counter}: {reference}  \n"
+                for ref_counter, reference in enumerate(metadata["references"], 1)
+            )
 
-            readme += "\n_This file has been automatically generated based on monitor and metadata contents. Any changes will be discarded._\n"
+            readme.append(
+                "\n_This file has been automatically generated based on monitor and metadata contents. Any changes will be discarded._\n"
+            )
 
             with open(f"{monitor_path}README.md", "w") as output_file:
-                output_file.write(readme)
-                output_file.write("\n")
+                output_file.write(f"{''.join(readme)}\n")
             return True
 
+    def attribute_row(self, key, value, references):
+        """
+        Formats a single attribute value as a README table row.
+
+        MITRE attributes with a defined value also get a link to their ATT&CK page added to the references.
+
+        Args:
+            key (str): The attribute name.
+            value (str): The attribute value.
+            references (list): The monitor references, extended in place with the MITRE link.
+
+        Returns:
+            str: The README table row for the attribute value.
+        """
+        mitre_path = MITRE_PATHS.get(key)
+        if mitre_path and value != "not defined":
+            references.append(
+                f"[{key} {value}](https://attack.mitre.org/{mitre_path}/{_mitre_id_path(value)}/)"
+            )
+        return f"| {key} | {value} |\n"
+
     def create_json(self, monitor, force=False):
         """
         Creates a metadata JSON file for a monitor.
 
         This method generates a metadata JSON file for a given monitor. It includes default fields and values, which
-        can be overridden with user-defined metadata from settings.json.
+        can be overridden with user-defined metadata from settings.json. The created metadata is stored in the
+        monitor_metadata dictionary, so it does not have to be read back from disk.
 
         Args:
             monitor (dict): The monitor configuration.
@@ -196,9 +294,6 @@ class Metadata:
             monitor_name = monitor["monitor"]["name"]
             monitor_path = f"{self.instance_path}{monitor_name}/"
 
-            if path.exists(f"{monitor_path}metadata.json") and not force:
-                return False
-
             data["id"] = monitor["_id"]
             data["description"] = "No description"
             data["author"] = "Unknown author"
@@ -223,17 +318,22 @@ class Metadata:
                 "metadata_template_references"
             )
             if metadata_template_references:
-                data["references"] = metadata_template_references
+                data["references"] = list(metadata_template_references)
             else:
                 data["references"] = [
                     "https://attack.mitre.org/datasources/",
                     "https://attack.mitre.org/matrices/enterprise/",
                 ]
 
-            # Write metadata.json file
-            with open(f"{monitor_path}metadata.json", "w") as output_file:
-                json.dump(data, output_file, indent=2)
-                output_file.write("\n")
+            # Write metadata.json file, exclusive creation fails if it already exists
+            try:
+                with open(
+                    f"{monitor_path}metadata.json", "w" if force else "x"
+                ) as output_file:
+                    output_file.write(f"{json.dumps(data, indent=2)}\n")
+            except FileExistsError:
+                return False
+            self.monitor_metadata[monitor["_id"]] = data
             return True
 
     def read_json(self, monitor):
@@ -255,22 +355,21 @@ class Metadata:
         if self.arg.dryrun:
             return True
 
-        # If metadata.json doesn't exist, create it
-        if not path.exists(f"{monitor_path}metadata.json"):
-            self.create_json(monitor)
-
         # Try to read metadata.json file and add contents to monitor_metadata dictionary
         try:
-            with open(f"{monitor_path}metadata.json", "r") as input_file:
-                try:
-                    metadata = json.load(input_file)
-                except Exception as e:
-                    self.helper.error(
-                        f"Can not parse '{monitor_path}metadata.json'.", e
-                    )
+            input_file = open(f"{monitor_path}metadata.json", "rb")
         except FileNotFoundError:
-            print("DEBUG: No metadata found.")
+            # If metadata.json doesn't exist, create it, which also stores the new metadata
+            if self.create_json(monitor):
+                return True
+            if self.arg.verbose:
+                print(f"DEBUG: No metadata found for monitor '{monitor_name}'.")
             return False
+        with input_file:
+            try:
+                metadata = json.loads(input_file.read())
+            except Exception as e:
+                self.helper.error(f"Can not parse '{monitor_path}metadata.json'.", e)
 
         self.monitor_metadata[monitor["_id"]] = metadata
         return True
@@ -1,10 +1,46 @@
 import requests
 import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from module.helpers import helper
 from dotenv import load_dotenv, find_dotenv
-from os import getenv
+from os import getenv, makedirs, path
 from rich import print
 
+WILDCARD_SPECIAL_CHARACTERS = re.compile(r"[\\*?]")
+SEVERITY_LEVELS = {"CRITICAL": 1, "HIGH": 2, "MEDIUM": 3, "LOW": 4, "INFO": 5}
+
+
+class OpenSearchHTTPError(RuntimeError):
+    """
+    Raised when the OpenSearch instance answers a request with an unexpected status code.
+
+    The error is raised instead of exiting, so callers running requests concurrently can handle a failed request
+    without stopping the others. The command line reports it through helper.error.
+
+    Attributes:
+        status_code (int): The HTTP status code of the response.
+        url (str): The URL of the request.
+        body (str): The body of the response.
+    """
+
+    def __init__(self, status_code, url, body):
+        """
+        Initializes the OpenSearchHTTPError with the details of the failed request.
+
+        Args:
+            status_code (int): The HTTP status code of the response.
+            url (str): The URL of the request.
+            body (str): The body of the response.
+        """
+        super().__init__(f"Server {url} returned error {status_code}: {body}")
+        self.status_code = status_code
+        self.url = url
+        self.body = body
+
 
 class ManageRemoteMonitors:
     """
@@ -23,19 +59,27 @@ class ManageRemoteMonitors:
         username (str): The username for authenticating with the OpenSearch instance.
         password (str): The password for authenticating with the OpenSearch instance.
         monitors (dict): A dictionary to store monitor information.
+        version (dict): The cached version information of the OpenSearch instance, or None until requested.
+        channel_cache_file (str): The file path of the instance's notification channel cache in the user cache directory.
+        session (requests.Session): A pooled HTTP session that keeps connections to the OpenSearch instance alive.
 
     Methods:
         print_username(): Returns the username.
-        get(uri_path, data=None): Performs a GET request to the OpenSearch instance.
+        close(): Closes the pooled HTTP connections.
+        get(uri_path, data=None, params=None): Performs a GET request to the OpenSearch instance.
         put(uri_path, data): Performs a PUT request to update a resource in OpenSearch.
         post(uri_path, data): Performs a POST request to create a resource in OpenSearch.
+        normalize_monitor(document): Brings a monitor document from the API into the stored monitor format.
         load_monitors(): Loads monitor data from OpenSearch.
         get_monitor_contents(monitor_id): Retrieves contents of a specific monitor.
         update_monitor(monitor_id, monitor_contents): Updates a monitor with given contents.
         create_monitor(monitor): Creates a new monitor in OpenSearch.
         get_notification_channels(): Retrieves notification channel information from OpenSearch.
+        get_version(): Retrieves the version information of the OpenSearch instance.
+        store_channel_cache(notification_channels): Stores notification channel information in the channel cache.
         get_alerts(): Retrieves alerts from the OpenSearch alerting system.
         run_monitor(monitor_id): Executes a monitor and returns the result.
+        run_monitors(monitor_ids): Executes a batch of monitors concurrently and yields the results in order.
     """
 
     headers = {"Content-Type": "application/json"}
@@ -54,10 +98,14 @@ class ManageRemoteMonitors:
         self.arg = arg
         self.config = config
         self.instance = instance
-        self.unsafe_characters = '/\?%*:|"<>.'
         self.username = getenv(self.instance["env_username"])
         self.password = getenv(self.instance["env_password"])
         self.monitors = {}
+        self.version = None
+        cache_root = getenv("XDG_CACHE_HOME") or path.expanduser("~/.cache")
+        self.channel_cache_file = (
+            f"{cache_root}/aiven-monitor-manager/channels-{self.instance['name']}.json"
+        )
 
         if not self.username or not self.password:
             self.helper.error(
@@ -68,6 +116,23 @@ class ManageRemoteMonitors:
                 "Aborting! String 'AVNS_' found in username, are you sure that's not your password?"
             )
 
+        # Reuse connections across requests, with enough pooled connections for concurrent monitor runs. Idempotent
+        # requests are retried on transient gateway and throttling errors.
+        self.session = requests.Session()
+        self.session.auth = (self.username, self.password)
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_maxsize=max(10, self.config["global"].get("run_concurrency", 8)),
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
     def print_username(self):
         """
         Returns the username used for authentication with the OpenSearch instance.
@@ -77,36 +142,39 @@ class ManageRemoteMonitors:
         """
         return str(self.username)
 
-    def get(self, uri_path, data=None):
+    def close(self):
+        """
+        Closes the pooled HTTP connections to the OpenSearch instance.
+        """
+        self.session.close()
+
+    def get(self, uri_path, data=None, params=None):
         """
-        Performs an HTTP GET request to the specified URI path on the OpenSearch instance and returns the JSON response.
+        Performs an HTTP GET request to the specified URI path on the OpenSearch instance and returns the parsed JSON
+        response.
 
         Args:
             uri_path (str): The URI path to query.
             data (dict, optional): Additional data to send with the request. Defaults to None.
+            params (dict, optional): Query string parameters to encode into the URL. Defaults to None.
 
         Returns:
-            str: The response from the OpenSearch instance as a JSON string.
+            dict: The JSON response from the OpenSearch instance.
 
         Raises:
-            SystemExit: If the response status code is not 200.
-            requests.exceptions.ConnectionError: If a connection error occurs.
+            OpenSearchHTTPError: If the response status code is not 200.
+            SystemExit: If a connection error occurs.
         """
         try:
-            response = requests.get(
-                f"{self.instance['url']}{uri_path}",
-                headers=self.headers,
-                auth=(self.username, self.password),
-                data=data,
+            response = self.session.get(
+                f"{self.instance['url']}{uri_path}", data=data, params=params
             )
             if response.status_code == 200:
-                json_data = json.loads(response.text)
-                return json.dumps(json_data, indent=2)
+                return json.loads(response.content)
             else:
-                print(
-                    f"Server {self.instance['url']} returned error {response.status_code}: {response.text}"
+                raise OpenSearchHTTPError(
+                    response.status_code, response.url, response.text
                 )
-                exit(1)
         except requests.exceptions.ConnectionError as e:
             self.helper.error(
                 "Connection error. Please check connectivity to the address of your instance.",
@@ -122,36 +190,25 @@ class ManageRemoteMonitors:
             data (str): The data to be sent in the request body as a string.
 
         Returns:
-            bool: True if the update is successful, False otherwise.
+            dict: The JSON response from the OpenSearch instance, which contains the updated resource.
 
         Raises:
             requests.exceptions.RequestException: If there is an error with the request.
+            OpenSearchHTTPError: If the response status code is not 200.
 
         """
-        if self.arg.dryrun:
-            return True
-
+        response = self.session.put(f"{self.instance['url']}{uri_path}", data=data)
+        if response.status_code == 200:
+            return json.loads(response.content)
         else:
-            response = requests.put(
-                f"{self.instance['url']}{uri_path}",
-                headers=self.headers,
-                auth=(self.username, self.password),
-                data=data,
-            )
-            if response.status_code == 200:
-                return True
-            else:
-                self.helper.error(
-                    f"Server {self.instance['url']} returned error {response.status_code}: {response.text}"
-                )
+            raise OpenSearchHTTPError(response.status_code, response.url, response.text)
 
     def post(self, uri_path, data):
         """
         Sends an HTTP POST request to create a new resource on the OpenSearch instance.
 
         This method is used to create new resources, such as monitors or alerts, on the OpenSearch instance by sending
-        the specified data to a given API path. The method supports a dry run mode, which simulates the POST request
-        without actually creating the resource on OpenSearch.
+        the specified data to a given API path.
 
         Args:
             uri_path (str): The API path where the POST request should be sent. This path should be relative to the
@@ -161,39 +218,52 @@ class ManageRemoteMonitors:
 
         Returns:
             dict or bool: Depending on the response status code:
-                - If the status code is 200, it returns a dictionary parsed from the response text.
+                - If the status code is 200, it returns a dictionary parsed from the response body.
                 - If the status code is 201, it indicates a successful resource creation, and a dictionary parsed
-                   from the response text is returned.
-                - If the `dryrun` flag is set, it returns the parsed data as a dictionary.
+                   from the response body is returned.
                 - In other cases, the method raises an error.
 
         Raises:
             requests.exceptions.RequestException: If there is an error in making the POST request.
-            RuntimeError: If the OpenSearch server returns an unexpected status code, indicating a failure to create
-               the resource.
+            OpenSearchHTTPError: If the OpenSearch server returns an unexpected status code, indicating a failure to
+               create the resource.
 
         Note:
-            The method provides error handling for unexpected status codes by raising a RuntimeError with details from
-            the response. In `dryrun` mode, no actual POST request is made, and the method returns the parsed input
-            data, allowing for testing or validation of the data to be sent without affecting the OpenSearch instance.
+            The method provides error handling for unexpected status codes by raising an OpenSearchHTTPError with
+            details from the response. Dry runs use DryRunRemoteMonitors, which does not send the requests that create resources.
         """
-        if self.arg.dryrun:
-            return json.loads(data)
+        response = self.session.post(f"{self.instance['url']}{uri_path}", data=data)
+        if response.status_code == 200:
+            return json.loads(response.content)
+        elif response.status_code == 201:
+            return json.loads(response.content)
         else:
-            response = requests.post(
-                f"{self.instance['url']}{uri_path}",
-                headers=self.headers,
-                auth=(self.username, self.password),
-                data=data,
-            )
-            if response.status_code == 200:
-                return json.loads(response.text)
-            elif response.status_code == 201:
-                return json.loads(response.text)
-            else:
-                self.helper.error(
-                    f"Server {self.instance['url']} returned error {response.status_code}: {response.text}"
-                )
+            raise OpenSearchHTTPError(response.status_code, response.url, response.text)
+
+    def normalize_monitor(self, document):
+        """
+        Brings a monitor document returned by the OpenSearch API into the format used for stored monitors.
+
+        Search hits are rebuilt in a single pass without the '_index' and '_score' fields and with '_source' renamed
+        to 'monitor'. Documents from the monitor endpoints already use that format. In both cases the
+        'last_update_time' field is reset to 0 so that it does not show up as a difference.
+
+        Args:
+            document (dict): A monitor search hit or a monitor document from the OpenSearch API.
+
+        Returns:
+            dict: The monitor document in the stored monitor format.
+        """
+        if "_source" in document:
+            source = document["_source"]
+            document = {
+                key: value
+                for key, value in document.items()
+                if key not in ("_index", "_score", "_source")
+            }
+            document["monitor"] = source
+        document["monitor"]["last_update_time"] = 0
+        return document
 
     def load_monitors(self):
         """
@@ -214,24 +284,43 @@ class ManageRemoteMonitors:
 
         Note:
             The method uses a 'match_all' query to retrieve up to 10,000 monitors, which should suffice for most
-            instances. If a filter is set in the class configuration, only monitors with names containing the filter
-            text (case-insensitive) are included in the `monitors` dictionary. The method also standardizes the monitor
+            instances. If a filter is set in the class configuration, only monitors with names containing any of the
+            filter terms (case-insensitive) are included in the `monitors` dictionary. The filter terms are also sent
+            as case-insensitive wildcard queries, so OpenSearch only returns candidate monitors. The method also standardizes the monitor
             data by resetting the 'last_update_time' field to 0 for each monitor and restructuring the response
             format for consistency.
         """
 
-        query = '{"size": 10000,"query": {"match_all": {}}}'
-        response = json.loads(
-            self.get("/_plugins/_alerting/monitors/_search", data=query)
+        query = {"match_all": {}}
+        if self.config["filter"]:
+            terms = [
+                WILDCARD_SPECIAL_CHARACTERS.sub(r"\\\g<0>", term)
+                for term in self.helper.split_filter(self.arg.filter)
+            ]
+            query = {
+                "bool": {
+                    "should": [
+                        {
+                            "wildcard": {
+                                "monitor.name.keyword": {
+                                    "value": f"*{term}*",
+                                    "case_insensitive": True,
+                                }
+                            }
+                        }
+                        for term in terms
+                    ],
+                    "minimum_should_match": 1,
+                }
+            }
+        response = self.get(
+            "/_plugins/_alerting/monitors/_search",
+            data=json.dumps({"size": 10000, "query": query}),
         )
-        for monitor in response["hits"]["hits"]:
-            del monitor["_index"]
-            del monitor["_score"]
-            monitor["monitor"] = monitor.pop("_source")
-            monitor["monitor"]["last_update_time"] = 0
-
+        for hit in response["hits"]["hits"]:
+            monitor = self.normalize_monitor(hit)
             if self.config["filter"]:
-                if self.config["filter"].lower() in monitor["monitor"]["name"].lower():
+                if self.config["filter"].search(monitor["monitor"]["name"]):
                     self.monitors[monitor["_id"]] = monitor
             else:
                 self.monitors[monitor["_id"]] = monitor
@@ -264,18 +353,15 @@ class ManageRemoteMonitors:
             deliberate choice to standardize the data format, especially when used for comparisons or subsequent
             processing.
         """
-        request = self.get(f"/_plugins/_alerting/monitors/{monitor_id}")
-        monitor_contents = json.loads(request)
-        monitor_contents["monitor"]["last_update_time"] = 0
-        return monitor_id, monitor_contents
+        monitor_contents = self.get(f"/_plugins/_alerting/monitors/{monitor_id}")
+        return monitor_id, self.normalize_monitor(monitor_contents)
 
     def update_monitor(self, monitor_id, monitor_contents):
         """
         Updates a specified monitor on the OpenSearch instance with new content.
 
         This method sends a request to the OpenSearch API to update an existing monitor with the provided contents.
-        It is capable of handling full monitor configurations including conditions, triggers, and actions. If the
-        `dryrun` flag is set, the monitor will not be actually updated, but the intended changes will be returned.
+        It is capable of handling full monitor configurations including conditions, triggers, and actions.
 
         Args:
             monitor_id (str): The unique identifier of the monitor to be updated.
@@ -284,8 +370,7 @@ class ManageRemoteMonitors:
 
         Returns:
             tuple: A tuple where the first element is the monitor ID and the second element is a dictionary containing
-              the updated monitor contents. If `dryrun` is set, the returned contents will be the same as the input
-              `monitor_contents`.
+              the updated monitor contents.
 
         Raises:
             requests.exceptions.RequestException: If an error occurs during the PUT request to the OpenSearch API.
@@ -293,22 +378,19 @@ class ManageRemoteMonitors:
             This may indicate a problem with the API response.
 
         Note:
-            The method prints a message to the console indicating the beginning of the update process. If the `dryrun`
-             flag is set in the `arg` attribute, no actual update will take place, and the method will simply return
-              the provided `monitor_id` and `monitor_contents`.
+            The method prints a message to the console indicating the beginning of the update process. The updated
+            monitor is taken from the PUT response, which already contains the stored monitor, so it is not requested
+            again.
         """
         print(
             f" - Updating monitor {monitor_contents['monitor']['name']} {monitor_id}..."
         )
 
-        if self.arg.dryrun:
-            return monitor_id, monitor_contents
-
-        else:
-            json_data = json.dumps(monitor_contents["monitor"], indent=2)
-            self.put(f"/_plugins/_alerting/monitors/{monitor_id}", json_data)
-            monitor_id, updated_monitor = self.get_monitor_contents(monitor_id)
-            return monitor_id, updated_monitor
+        json_data = json.dumps(monitor_contents["monitor"], separators=(",", ":"))
+        updated_monitor = self.put(
+            f"/_plugins/_alerting/monitors/{monitor_id}", json_data
+        )
+        return monitor_id, self.normalize_monitor(updated_monitor)
 
     def create_monitor(self, monitor):
         """
@@ -316,8 +398,7 @@ class ManageRemoteMonitors:
 
         This method submits a new monitor configuration to OpenSearch via an HTTP POST request. The monitor's
         configuration is specified in the provided dictionary. It includes various settings such as conditions,
-        triggers, actions, and scheduling details. If the `dryrun` flag is set, the monitor creation is simulated and
-        the monitor configuration is returned without actual creation in OpenSearch.
+        triggers, actions, and scheduling details.
 
         Args:
             monitor (dict): A dictionary containing the full configuration of the monitor to be created.
@@ -333,20 +414,11 @@ class ManageRemoteMonitors:
             requests.exceptions.RequestException: If there is an error with the POST request to the OpenSearch API.
             json.JSONDecodeError: If there is an issue decoding the JSON response from OpenSearch, indicating a
               possible problem with the response format.
-
-        Note:
-            If the `dryrun` flag is enabled, the method will not actually create the monitor on OpenSearch. Instead, it
-            will return the provided monitor configuration along with a simulated monitor ID, allowing for testing or
-            validation of the configuration without affecting the OpenSearch instance.
         """
-        if self.arg.dryrun:
-            return monitor["_id"], monitor
-
-        else:
-            json_data = json.dumps(monitor)
-            new_monitor = self.post(f"/_plugins/_alerting/monitors/", json_data)
-            new_monitor["monitor"]["last_update_time"] = 0
-            return new_monitor["_id"], new_monitor
+        json_data = json.dumps(monitor)
+        new_monitor = self.post(f"/_plugins/_alerting/monitors/", json_data)
+        new_monitor = self.normalize_monitor(new_monitor)
+        return new_monitor["_id"], new_monitor
 
     def get_notification_channels(self):
         """
@@ -370,35 +442,81 @@ class ManageRemoteMonitors:
             The method differentiates between OpenSearch version 1 and version 2, as they have different API endpoints
             and response formats for notification channel configurations. If the version is neither 1 nor 2, a
             RuntimeError is raised, indicating an unsupported OpenSearch version.
+
+            Channels can be cached in the user cache directory by setting the global 'channel_cache_ttl' setting to
+            the number of seconds the cache is reused. The cache is disabled by default (TTL 0) and is never used
+            with --validate, which always checks against the current channels.
         """
-        request = self.get("/")
-        version_data = json.loads(request)
-        version = version_data["version"]["number"]
-        version_parts = version.split(".")
+        ttl = (
+            0
+            if self.arg.validate
+            else self.config["global"].get("channel_cache_ttl", 0)
+        )
+        if ttl:
+            try:
+                if time.time() - path.getmtime(self.channel_cache_file) < ttl:
+                    with open(self.channel_cache_file, "r") as cache_file:
+                        return json.loads(cache_file.read())
+            except (FileNotFoundError, json.decoder.JSONDecodeError):
+                pass
+
+        version = self.get_version()
+        major_version = version["number"].split(".")[0]
         notification_channels = {}
 
-        if version_parts[0] == "2":
-            request = self.get("/_plugins/_notifications/configs")
-            output = json.loads(request)
+        if major_version == "2":
+            output = self.get("/_plugins/_notifications/configs")
             for config_item in output["config_list"]:
                 notification_channels[config_item["config_id"]] = config_item["config"][
                     "name"
                 ]
 
-        elif version_parts[0] == "1":
-            request = self.get("/_plugins/_alerting/destinations")
-            output = json.loads(request)
+        elif major_version == "1":
+            output = self.get("/_plugins/_alerting/destinations")
             for config_item in output["destinations"]:
                 notification_channels[config_item["id"]] = config_item["name"]
 
         else:
             self.helper.error(
                 "Unknown OpenSearch major version - expecting version 1 or 2. Can not retrieve notification channels.",
-                version_data,
+                version,
             )
 
+        if ttl:
+            self.store_channel_cache(notification_channels)
         return notification_channels
 
+    def get_version(self):
+        """
+        Retrieves the version information of the OpenSearch instance.
+
+        The version is requested once and reused for the lifetime of the client.
+
+        Returns:
+            dict: The version information reported by the OpenSearch instance, including the version number.
+        """
+        if self.version is None:
+            self.version = self.get("/")["version"]
+        return self.version
+
+    def store_channel_cache(self, notification_channels):
+        """
+        Stores notification channel information in the channel cache file.
+
+        Args:
+            notification_channels (dict): A dictionary of notification channel IDs and names.
+
+        Returns:
+            bool: True if the cache was written successfully, False otherwise.
+        """
+        try:
+            makedirs(path.dirname(self.channel_cache_file), exist_ok=True)
+            with open(self.channel_cache_file, "w") as cache_file:
+                cache_file.write(json.dumps(notification_channels))
+            return True
+        except OSError:
+            return False
+
     def get_alerts(self):
         """
         Retrieves a list of alerts from the OpenSearch instance, optionally filtered by severity, state, and size.
@@ -423,36 +541,22 @@ class ManageRemoteMonitors:
             The method is designed to provide a flexible way to query a potentially large set of alert data from OpenSearch.
         """
 
-        state = ""
-        severity = ""
-        size = "100"
+        params = {
+            "size": self.arg.size[0] if self.arg.size else 100,
+            "sortString": "start_time",
+            "sortOrder": "asc",
+        }
 
-        if self.arg.size:
-            size = str(self.arg.size[0])
+        if self.arg.severity:
+            level = SEVERITY_LEVELS.get(self.arg.severity[0].upper())
+            if level:
+                params["severityLevel"] = level
 
         if self.arg.state:
-            state = f"&alertState={self.arg.state[0].upper()}"
+            params["alertState"] = self.arg.state[0].upper()
 
-        if self.arg.severity:
-            if self.arg.severity[0].upper() == "INFO":
-                severity = f"&severityLevel=5"
-            elif self.arg.severity[0].upper() == "LOW":
-                severity = f"&severityLevel=4"
-            elif self.arg.severity[0].upper() == "MEDIUM":
-                severity = f"&severityLevel=3"
-            elif self.arg.severity[0].upper() == "HIGH":
-                severity = f"&severityLevel=2"
-            elif self.arg.severity[0].upper() == "CRITICAL":
-                severity = f"&severityLevel=1"
-            else:
-                severity = ""
-
-        request = self.get(
-            f"/_plugins/_alerting/monitors/alerts?size={size}&sortString=start_time&sortOrder=asc{severity}{state}"
-        )
-        alerts = json.loads(request)
-        alerts = alerts["alerts"]
-        return alerts
+        alerts = self.get("/_plugins/_alerting/monitors/alerts", params=params)
+        return alerts["alerts"]
 
     def run_monitor(self, monitor_id):
         """
@@ -472,8 +576,110 @@ class ManageRemoteMonitors:
         Raises:
             requests.exceptions.RequestException: If there is an error with the POST request.
             json.JSONDecodeError: If there is an error decoding the JSON response from the POST request.
+            OpenSearchHTTPError: If the OpenSearch server returns an unexpected status code.
         """
         result = self.post(
             f"/_plugins/_alerting/monitors/{monitor_id}/_execute?dryrun=true", data=""
         )
         return result
+
+    def run_monitors(self, monitor_ids):
+        """
+        Executes a batch of monitors in dry run mode and yields the results in the order of the given IDs.
+
+        The Alerting plugin has no batch execution endpoint, so the monitors are executed concurrently using a thread
+        pool sized by the global 'run_concurrency' setting. Results are still yielded in submission order, so the
+        output of --run does not change between invocations. A monitor whose execution request fails is reported with
+        its error, and the remaining monitors still run.
+
+        Args:
+            monitor_ids (list): The IDs of the monitors to execute.
+
+        Yields:
+            tuple: A tuple containing the monitor ID, a dictionary with the results of the monitor execution or None if
+              the request failed, and the OpenSearchHTTPError of the failed request or None.
+        """
+        with ThreadPoolExecutor(
+            max_workers=self.config["global"].get("run_concurrency", 8)
+        ) as executor:
+            futures = [
+                (monitor_id, executor.submit(self.run_monitor, monitor_id))
+                for monitor_id in monitor_ids
+            ]
+            for monitor_id, future in futures:
+                try:
+                    result = future.result()
+                except OpenSearchHTTPError as e:
+                    yield monitor_id, None, e
+                    continue
+                yield monitor_id, result, None
+
+
+class DryRunRemoteMonitors(ManageRemoteMonitors):
+    """
+    A dry run variant of ManageRemoteMonitors that never modifies the OpenSearch instance.
+
+    Monitors, alerts and notification channels are read from OpenSearch as usual, and monitors can still be test run
+    as monitor execution does not trigger actions. Creating and updating monitors is simulated and returns the
+    contents that would have been sent.
+
+    Methods:
+        put(uri_path, data): Skips the PUT request.
+        store_channel_cache(notification_channels): Skips writing the notification channel cache.
+        update_monitor(monitor_id, monitor_contents): Simulates a monitor update.
+        create_monitor(monitor): Simulates creating a new monitor.
+    """
+
+    def put(self, uri_path, data):
+        """
+        Skips the HTTP PUT request.
+
+        Args:
+            uri_path (str): The API path to update the monitor.
+            data (str): The data that would have been sent in the request body.
+
+        Returns:
+            dict: Always an empty response.
+        """
+        return {}
+
+    def store_channel_cache(self, notification_channels):
+        """
+        Skips writing the notification channel cache, as dry runs do not write any files.
+
+        Args:
+            notification_channels (dict): A dictionary of notification channel IDs and names.
+
+        Returns:
+            bool: Always True.
+        """
+        return True
+
+    def update_monitor(self, monitor_id, monitor_contents):
+        """
+        Simulates updating a monitor on the OpenSearch instance.
+
+        Args:
+            monitor_id (str): The unique identifier of the monitor to be updated.
+            monitor_contents (dict): A dictionary containing the new contents for the monitor.
+
+        Returns:
+            tuple: The provided monitor ID and monitor contents.
+        """
+        print(
+            f" - Updating monitor {monitor_contents['monitor']['name']} {monitor_id}..."
+        )
+        return monitor_id, monitor_contents
+
+    def create_monitor(self, monitor):
+        """
+        Simulates creating a new monitor on the OpenSearch instance.
+
+        Args:
+            monitor (dict): A dictionary containing the full configuration of the monitor to be created.
+
+        Returns:
+            tuple: A tuple containing a placeholder monitor ID and the monitor in the format returned by OpenSearch.
+        """
+        monitor_id = f"dryrun-{monitor['name']}"
+        return monitor_id, {"_id": monitor_id, "_version": 1, "monitor": monitor}
@@ -1,5 +1,7 @@
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 class SlackMessageBuilder:
@@ -13,14 +15,22 @@ class SlackMessageBuilder:
         config (dict): A dictionary containing configuration data for the SlackMessageBuilder.
         slack_message (dict): A dictionary representing the Slack message being built.
         slack_webhook (str): The URL of the Slack webhook to which the message will be sent.
+        session (requests.Session): A session reused for all webhook requests to keep the connection alive.
+        max_blocks (int): The maximum number of blocks Slack accepts in a single message.
+        timeout (int): The number of seconds to wait for the webhook to connect and respond.
 
     Methods:
         __init__(self, config): Constructor method for initializing the SlackMessageBuilder.
         __str__(self): Returns a string representation of the Slack message being built.
         add(self, type, format, content): Adds a block to the Slack message being built.
         send(self): Sends the Slack message to the configured webhook.
+        flush(self): Sends the Slack message and clears the sent blocks.
+        clear(self): Clears the buffered blocks without sending them.
     """
 
+    max_blocks = 50
+    timeout = 10
+
     def __init__(self, config):
         """
         Constructor method for initializing the SlackMessageBuilder.
@@ -29,9 +39,22 @@ class SlackMessageBuilder:
             config (dict): A dictionary containing configuration data for the SlackMessageBuilder.
         """
         self.config = config
-        self.slack_message = {}
-        self.slack_message["blocks"] = []
+        self.slack_message = {"blocks": []}
         self.slack_webhook = self.config["global"]["slack webhook"]
+        self.session = requests.Session()
+        # Retry only rate-limited posts, which Slack rejects without posting, honouring its Retry-After header
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=[429],
+                    allowed_methods=["POST"],
+                    raise_on_status=False,
+                )
+            ),
+        )
 
     def __str__(self):
         """
@@ -46,6 +69,8 @@ class SlackMessageBuilder:
         """
         Adds a block to the Slack message being built.
 
+        If the message already holds the maximum number of blocks, the buffered blocks are sent first.
+
         Args:
             type (str, optional): The type of block to add. Defaults to "section".
             format (str, optional): The format of the text in the block. Defaults to "mrkdwn".
@@ -54,17 +79,15 @@ class SlackMessageBuilder:
         Returns:
             None
         """
+        if len(self.slack_message["blocks"]) >= self.max_blocks:
+            self.flush()
+
         if type == "divider":
-            slack_block = {}
-            slack_block["type"] = "divider"
-            self.slack_message["blocks"].append(slack_block)
+            self.slack_message["blocks"].append({"type": "divider"})
         else:
-            slack_block = {}
-            slack_block["type"] = type
-            slack_block["text"] = {}
-            slack_block["text"]["type"] = format
-            slack_block["text"]["text"] = content
-            self.slack_message["blocks"].append(slack_block)
+            self.slack_message["blocks"].append(
+                {"type": type, "text": {"type": format, "text": content}}
+            )
 
     def send(self):
         """
@@ -77,4 +100,26 @@ class SlackMessageBuilder:
             None
         """
         if self.slack_webhook[0:5] == "https":
-            requests.post(self.slack_webhook, str(self.slack_message))
+            self.session.post(
+                self.slack_webhook, json=self.slack_message, timeout=self.timeout
+            )
+
+    def flush(self):
+        """
+        Sends the buffered Slack message and clears its blocks so that following blocks start a new message.
+
+        Returns:
+            None
+        """
+        if self.slack_message["blocks"]:
+            self.send()
+            self.slack_message["blocks"] = []
+
+    def clear(self):
+        """
+        Clears the buffered blocks without sending them.
+
+        Returns:
+            None
+        """
+        self.slack_message["blocks"] = []
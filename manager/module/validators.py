@@ -1,5 +1,71 @@
 import chevron
+from collections import defaultdict
+import functools
 import json
+from module.helpers import iter_actions
+
+RESULT_PASS = "[green]Pass[/green]"
+RESULT_FAIL = "[red]Fail[/red]"
+RESULT_MISS = "[yellow]Miss[/yellow]"
+RESULT_ERROR = "[red]Err[/red]"
+OPSGENIE_PRIORITY = "P{{ctx.trigger.severity}}"
+
+
+def _unwrap(monitor):
+    """
+    Returns the monitor configuration from a stored monitor document.
+
+    Validators accept both the stored document, which holds the configuration under 'monitor' next to '_id' and
+    '_version', and the bare monitor configuration.
+
+    Args:
+        monitor (dict): A stored monitor document or a monitor configuration.
+
+    Returns:
+        dict: The monitor configuration.
+    """
+    if "monitor" in monitor:
+        return monitor["monitor"]
+    return monitor
+
+
+@functools.lru_cache(maxsize=1024)
+def _mustache_tokens(source):
+    """
+    Tokenizes a Mustache template once and caches the result.
+
+    Monitors often share the same message template, so the token list is reused instead of parsing the template
+    again for every action. Syntax errors are raised while tokenizing and are not cached.
+
+    Args:
+        source (str): The Mustache template source.
+
+    Returns:
+        tuple: The parsed template tokens.
+    """
+    return tuple(chevron.tokenizer.tokenize(source))
+
+
+@functools.lru_cache(maxsize=1024)
+def _opsgenie_fields(source):
+    """
+    Parses an OpsGenie message template once and caches the fields used for validation.
+
+    Args:
+        source (str): The message template source, expected to be a JSON document.
+
+    Returns:
+        tuple: The 'message', 'description' and 'priority' values, None for any key that is missing.
+
+    Raises:
+        json.decoder.JSONDecodeError: If the template is not valid JSON. Errors are not cached.
+    """
+    opsgenie_json = json.loads(source)
+    return (
+        opsgenie_json.get("message"),
+        opsgenie_json.get("description"),
+        opsgenie_json.get("priority"),
+    )
 
 
 class Validate:
@@ -13,10 +79,9 @@ class Validate:
     Attributes:
         arg (Namespace): An object containing command line arguments.
         config (dict): Configuration settings for validation.
-        errors (dict): A dictionary to store validation errors, indexed by monitor names.
+        errors (defaultdict): Lists of validation errors, indexed by monitor names.
 
     Methods:
-        init_errors(monitor): Initializes the error tracking for a given monitor.
         enabled(monitor): Validates if a monitor is enabled.
         opsgenie(monitor): Validates the OpsGenie configuration of a monitor.
         slack(monitor): Validates the Slack configuration of a monitor.
@@ -27,24 +92,7 @@ class Validate:
     def __init__(self, config, arg):
         self.arg = arg
         self.config = config
-        self.errors = {}
-
-    def init_errors(self, monitor):
-        """
-        Initializes the error list for a given monitor.
-
-        This method is called to set up an empty list of errors for a monitor, which will be populated during the
-        validation process.
-
-        Args:
-            monitor (dict): The monitor configuration.
-
-        Returns:
-            None
-        """
-        if monitor.get("_id") != False:
-            monitor = monitor["monitor"]
-        self.errors[monitor["name"]] = []
+        self.errors = defaultdict(list)
 
     def enabled(self, monitor):
         """
@@ -60,28 +108,27 @@ class Validate:
             tuple: A tuple containing a boolean indicating if the monitor is enabled and a string representing the
               validation result for display.
         """
-        if monitor.get("_id") != False:
-            monitor = monitor["monitor"]
+        monitor = _unwrap(monitor)
 
         if not monitor["name"]:
-            return False, "[red]Err[/red]"
-
-        try:
-            if monitor["enabled"] is True:
-                return True, "[green]Yes[/green]"
-            elif monitor["enabled"] is False:
-                self.errors[monitor["name"]].append("Monitor disabled")
-                return False, "[red]No[/red]"
-            else:
-                self.errors[monitor["name"]].append(
-                    "Unknown value for 'monitor.enabled', expecting boolean"
-                )
-                return False, "[yellow]Unknown[/yellow]"
-        except KeyError:
+            return False, RESULT_ERROR
+
+        enabled = monitor.get("enabled")
+        if enabled is True:
+            return True, "[green]Yes[/green]"
+        elif enabled is False:
+            self.errors[monitor["name"]].append("Monitor disabled")
+            return False, "[red]No[/red]"
+        elif "enabled" not in monitor:
             self.errors[monitor["name"]].append(
                 "Key and value for 'monitor.enabled' not found."
             )
-            return False, "[red]Fail[/red]"
+            return False, RESULT_FAIL
+        else:
+            self.errors[monitor["name"]].append(
+                "Unknown value for 'monitor.enabled', expecting boolean"
+            )
+            return False, "[yellow]Unknown[/yellow]"
 
     def opsgenie(self, monitor):
         """
@@ -97,77 +144,63 @@ class Validate:
             tuple: A tuple containing a boolean indicating the validation result and a string representing the
               result for display.
         """
-        if monitor.get("_id") != False:
-            monitor = monitor["monitor"]
+        monitor = _unwrap(monitor)
 
         if not monitor["name"]:
-            return False, "[red]Err[/red]"
+            return False, RESULT_ERROR
 
         if monitor["triggers"]:
-            for trigger in monitor["triggers"]:
-                actions = []
-                try:
-                    for action in trigger["query_level_trigger"]["actions"]:
-                        actions.append(action)
-                except KeyError:
-                    pass
+            for trigger, level, action in iter_actions(monitor):
+                if len(action["subject_template"]["source"]) != 0:
+                    self.errors[monitor["name"]].append(
+                        "Slack message set, OpsGenie webhook will fail"
+                    )
+                    return False, RESULT_FAIL
 
                 try:
-                    for action in trigger["document_level_trigger"]["actions"]:
-                        actions.append(action)
-                except KeyError:
-                    pass
-                for action in actions:
-                    if len(action["subject_template"]["source"]) != 0:
+                    message, description, priority = _opsgenie_fields(
+                        action["message_template"]["source"]
+                    )
+
+                    if not message:
+                        self.errors[monitor["name"]].append(
+                            "Key error, OpsGenie mandatory key 'message' missing."
+                        )
+                        return False, RESULT_FAIL
+
+                    if not description:
+                        self.errors[monitor["name"]].append(
+                            "Key error, OpsGenie key 'description' missing."
+                        )
+                        return False, RESULT_FAIL
+
+                    if not priority:
                         self.errors[monitor["name"]].append(
-                            "Slack message set, OpsGenie webhook will fail"
+                            "Key error, OpsGenie key 'priority' missing."
                         )
-                        return False, "[red]Fail[/red]"
-
-                    try:
-                        opsgenie_json = json.loads(action["message_template"]["source"])
-                        message = opsgenie_json.get("message")
-                        description = opsgenie_json.get("description")
-                        priority = opsgenie_json.get("priority")
-
-                        if not message:
-                            self.errors[monitor["name"]].append(
-                                "Key error, OpsGenie mandatory key 'message' missing."
-                            )
-                            return False, "[red]Fail[/red]"
-
-                        if not description:
-                            self.errors[monitor["name"]].append(
-                                "Key error, OpsGenie key 'description' missing."
-                            )
-                            return False, "[red]Fail[/red]"
-
-                        if not priority:
-                            self.errors[monitor["name"]].append(
-                                "Key error, OpsGenie key 'priority' missing."
-                            )
-                            return False, "[red]Fail[/red]"
-
-                        if not priority.startswith("P"):
-                            self.errors[monitor["name"]].append(
-                                "Error in OpsGenie priority, value does not start with P"
-                            )
-                            return False, "[red]Fail[/red]"
-
-                        if priority != "P{{ctx.trigger.severity}}":
-                            self.errors[monitor["name"]].append(
-                                f"Priority is not defined with variable, is '{priority}'"
-                            )
-
-                        return True, "[green]Pass[/green]"
-
-                    except json.decoder.JSONDecodeError:
+                        return False, RESULT_FAIL
+
+                    if priority == OPSGENIE_PRIORITY:
+                        return True, RESULT_PASS
+
+                    if not priority.startswith("P"):
                         self.errors[monitor["name"]].append(
-                            "JSON decode error while parsing OpsGenie JSON"
+                            "Error in OpsGenie priority, value does not start with P"
                         )
-                        return False, "[red]Fail[/red]"
+                        return False, RESULT_FAIL
+
+                    self.errors[monitor["name"]].append(
+                        f"Priority is not defined with variable, is '{priority}'"
+                    )
+                    return True, RESULT_PASS
+
+                except json.decoder.JSONDecodeError:
+                    self.errors[monitor["name"]].append(
+                        "JSON decode error while parsing OpsGenie JSON"
+                    )
+                    return False, RESULT_FAIL
 
-        return False, "[yellow]Miss[/yellow]"
+        return False, RESULT_MISS
 
     def slack(self, monitor):
         """
@@ -183,36 +216,22 @@ class Validate:
             tuple: A tuple containing a boolean indicating the validation result and a string representing the result
               for display.
         """
-        if monitor["_id"]:
-            monitor = monitor["monitor"]
+        monitor = _unwrap(monitor)
 
         if not monitor["name"]:
-            return False, "[red]Err[/red]"
+            return False, RESULT_ERROR
 
         if monitor["triggers"]:
-            for trigger in monitor["triggers"]:
-                actions = []
-                try:
-                    for action in trigger["query_level_trigger"]["actions"]:
-                        actions.append(action)
-                except KeyError:
-                    pass
-
-                try:
-                    for action in trigger["document_level_trigger"]["actions"]:
-                        actions.append(action)
-                except KeyError:
-                    pass
-                for action in actions:
-                    if len(action["subject_template"]["source"]) < 1:
-                        self.errors[monitor["name"]].append("Slack subject missing")
-                        return False, "[red]Fail[/red]"
-                    if len(action["message_template"]["source"]) < 1:
-                        return False, "[red]Fail[/red]"
-            return True, "[green]Pass[/green]"
+            for trigger, level, action in iter_actions(monitor):
+                if len(action["subject_template"]["source"]) < 1:
+                    self.errors[monitor["name"]].append("Slack subject missing")
+                    return False, RESULT_FAIL
+                if len(action["message_template"]["source"]) < 1:
+                    return False, RESULT_FAIL
+            return True, RESULT_PASS
         else:
             self.errors[monitor["name"]].append("Monitor has no triggers")
-        return False, "[yellow]Miss[/yellow]"
+        return False, RESULT_MISS
 
     def mustache(self, monitor):
         """
@@ -228,39 +247,26 @@ class Validate:
             tuple: A tuple containing a boolean indicating the validation result, a string representing the result
               for display, and an additional message if applicable.
         """
-        if monitor.get("_id") != False:
-            monitor = monitor["monitor"]
+        monitor = _unwrap(monitor)
 
         if not monitor["name"]:
             return False, "None"
 
         if monitor["triggers"]:
-            for trigger in monitor["triggers"]:
-                actions = []
+            for trigger, level, action in iter_actions(monitor):
                 try:
-                    for action in trigger["query_level_trigger"]["actions"]:
-                        actions.append(action)
-                except KeyError:
-                    pass
-
-                try:
-                    for action in trigger["document_level_trigger"]["actions"]:
-                        actions.append(action)
-                except KeyError:
-                    pass
-                for action in actions:
-                    try:
-                        chevron.render(action["message_template"]["source"])
-                        # Check for presence of required Mustache values
-                        return True, "[green]Pass[/green]"
-                    except Exception as e:
-                        self.errors[monitor["name"]].append(
-                            f"Mustache rendering error: {e}"
-                        )
-                        return False, "[red]Fail[/red]"
+                    # Tokenizing raises on syntax errors, rendering without data adds nothing
+                    _mustache_tokens(action["message_template"]["source"])
+                    # Check for presence of required Mustache values
+                    return True, RESULT_PASS
+                except Exception as e:
+                    self.errors[monitor["name"]].append(
+                        f"Mustache rendering error: {e}"
+                    )
+                    return False, RESULT_FAIL
         else:
             self.errors[monitor["name"]].append("No triggers defined")
-            return False, "[yellow]Miss[/yellow]", ""
+            return False, RESULT_MISS, ""
 
     def channels(self, monitor, channels):
         """
@@ -277,31 +283,16 @@ class Validate:
             tuple: A tuple containing a boolean indicating the validation result, a string representing the result
               for display, and the name of the destination channel if found.
         """
-        if monitor.get("_id") != False:
-            monitor = monitor["monitor"]
+        monitor = _unwrap(monitor)
 
         if not monitor["name"]:
             return False, "None"
 
         if monitor["triggers"]:
-            for trigger in monitor["triggers"]:
-                actions = []
-                try:
-                    for action in trigger["query_level_trigger"]["actions"]:
-                        actions.append(action)
-                except KeyError:
-                    pass
-
-                try:
-                    for action in trigger["document_level_trigger"]["actions"]:
-                        actions.append(action)
-                except KeyError:
-                    pass
-                for action in actions:
-                    try:
-                        destination = channels[action["destination_id"]]
-                        return True, "[green]Pass[/green]", destination
-                    except KeyError:
-                        return False, "[red]Fail[/red]", "Not found"
+            for trigger, level, action in iter_actions(monitor):
+                destination = channels.get(action.get("destination_id"))
+                if destination is None:
+                    return False, RESULT_FAIL, "Not found"
+                return True, RESULT_PASS, destination
         else:
-            return False, "[yellow]Miss[/yellow]", ""
+            return False, RESULT_MISS, ""
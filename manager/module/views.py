@@ -1,8 +1,24 @@
+from collections import Counter
 from rich.console import Console
 from rich.table import Table
-from module.helpers import helper
+from module.helpers import helper, iter_actions
 from rich import print
 
+UNKNOWN_CHANNEL = "[red]Unknown notification channel[/red]"
+ALERT_STATES = {
+    "ERROR": "[red]ERROR[/red]",
+    "ACTIVE": "[green]ACTIVE[/green]",
+    "ACKNOWLEDGED": "[blue]ACKNOWLEDGED[/blue]",
+    "DELETED": "[yellow]DELETED[/yellow]",
+}
+ALERT_SEVERITIES = {
+    "1": "[bold red]CRIT[bold red]",
+    "2": "[red]HIGH[red]",
+    "3": "[yellow]MED[yellow]",
+    "4": "[yellow]LOW[/yellow]",
+    "5": "[blue]INFO[/blue]",
+}
+
 
 class View:
     """
@@ -58,66 +74,48 @@ class View:
         table.add_column("Notification", justify="left", no_wrap=True)
         table.add_column("Alerts", justify="left", no_wrap=True)
         table.add_column("Trigger", justify="left", no_wrap=True)
-        sortable = []
+        rows = set()
         channel_counter = {}
+        # Track updated monitors locally so the caller's diff is left intact
+        pending_updates = set(monitor_diff)
+        alert_counts = Counter(alert["monitor_id"] for alert in alerts)
         for source in [self.local, self.remote]:
             for id, content in source.items():
-                alert_count = 0
-                for alert in alerts:
-                    if alert["monitor_id"] == id:
-                        alert_count += 1
+                alert_count = alert_counts[id]
                 if alert_count > 0:
                     alert_count = f"[yellow]{alert_count} ->[/yellow]"
                 monitor = content["monitor"]
-                for trigger in monitor["triggers"]:
-                    actions = []
-                    mon_type = ""
-                    try:
-                        for action in trigger["query_level_trigger"]["actions"]:
-                            actions.append(action)
-                            mon_type = "query_level_trigger"
-                    except KeyError:
-                        pass
-
-                    try:
-                        for action in trigger["document_level_trigger"]["actions"]:
-                            actions.append(action)
-                            mon_type = "document_level_trigger"
-                    except KeyError:
-                        pass
-
-                    for action in actions:
-                        try:
-                            channel = notification_channels[action["destination_id"]]
-                        except KeyError:
-                            channel = "[red]Unknown notification channel[/red]"
-                        if content["_id"] in monitor_diff:
-                            has_updates = "[green]Yes[/green]"
-                            sortable.append(
-                                f"{monitor['name']}|{monitor['enabled']}|{has_updates}|[green]{content['_version']}[/green]|{channel}|{alert_count}|{trigger[mon_type]['name']}"
-                            )
-                            del monitor_diff[content["_id"]]
-                        else:
-                            has_updates = "No"
-                            sortable.append(
-                                f"{monitor['name']}|{monitor['enabled']}|{has_updates}|{content['_version']}|{channel}|{alert_count}|{trigger[mon_type]['name']}"
-                            )
+                for trigger, level, action in iter_actions(monitor):
+                    channel = notification_channels.get(
+                        action["destination_id"], UNKNOWN_CHANNEL
+                    )
+                    if content["_id"] in pending_updates:
+                        has_updates = "[green]Yes[/green]"
+                        version = f"[green]{content['_version']}[/green]"
+                        pending_updates.discard(content["_id"])
+                    else:
+                        has_updates = "No"
+                        version = str(content["_version"])
+                    rows.add(
+                        (
+                            monitor["name"],
+                            str(monitor["enabled"]),
+                            has_updates,
+                            version,
+                            channel,
+                            str(alert_count),
+                            trigger[level]["name"],
+                        )
+                    )
 
-        sortable = list(dict.fromkeys(sortable))
-        sortable.sort()
-        for line in sortable:
-            s = line.split("|")
-            try:
-                channel_counter[s[4]] += 1
-            except KeyError:
-                channel_counter[s[4]] = 1
-            table.add_row(s[0], s[1], s[2], s[3], s[4], s[5], s[6])
+        for row in sorted(rows):
+            channel_counter[row[4]] = channel_counter.get(row[4], 0) + 1
+            table.add_row(*row)
         self.console.print(table)
-        channel_count = []
-        for name, amount in channel_counter.items():
-            channel_count.append(f"{name}: {amount}")
         print("Monitor destinations: ", end="")
-        print(", ".join(channel_count))
+        print(
+            ", ".join(f"{name}: {amount}" for name, amount in channel_counter.items())
+        )
 
     def alerts(self, alerts, notification_channels):
         """
@@ -148,62 +146,55 @@ class View:
         table_monitor.add_column("Last notification", justify="left", no_wrap=True)
         table_monitor.add_column("History", justify="left", no_wrap=False)
 
+        # Index destination ids by monitor and trigger id once instead of walking the triggers for every alert
+        trigger_destinations = {}
+        incomplete_monitors = set()
+        for monitor_id, content in self.remote.items():
+            try:
+                for trigger in content["monitor"]["triggers"]:
+                    for trigger_contents in trigger.values():
+                        destinations = trigger_destinations.setdefault(
+                            (monitor_id, trigger_contents["id"]), []
+                        )
+                        for action in trigger_contents["actions"]:
+                            destinations.append(action["destination_id"])
+            except KeyError:
+                incomplete_monitors.add(monitor_id)
+
         for alert in alerts:
             if self.config["filter"]:
-                if self.config["filter"].lower() not in alert["monitor_name"].lower():
+                if not self.config["filter"].search(alert["monitor_name"]):
                     continue
             # Find destination by id from monitor data
-            dest_id_list = []
-            actions = []
-            try:
-                triggers = self.remote[alert["monitor_id"]]["monitor"]["triggers"]
-                for trigger in triggers:
-                    for level, trigger_contents in trigger.items():
-                        if trigger_contents["id"] == alert["trigger_id"]:
-                            for action in trigger_contents["actions"]:
-                                dest_id_list.append(action["destination_id"])
-            except KeyError:
+            dest_id_list = list(
+                trigger_destinations.get((alert["monitor_id"], alert["trigger_id"]), ())
+            )
+            if (
+                alert["monitor_id"] not in self.remote
+                or alert["monitor_id"] in incomplete_monitors
+            ):
                 dest_id_list.append("error")
-                pass
-
-            if len(dest_id_list) > 0:
-                for dest_id in dest_id_list:
-                    if dest_id == "error":
-                        actions.append("Key error!")
-                    else:
-                        actions.append(notification_channels[dest_id])
 
-                if len(actions) == 0:
-                    actions = "No actions"
-                elif len(actions) == 1:
-                    actions = str(actions[0])
-                else:
-                    actions = ", ".join(actions)
+            if dest_id_list:
+                actions = ", ".join(
+                    (
+                        "Key error!"
+                        if dest_id == "error"
+                        else notification_channels.get(dest_id, UNKNOWN_CHANNEL)
+                    )
+                    for dest_id in dest_id_list
+                )
+            else:
+                actions = "No actions"
             start_time = self.helper.timestamp_to_string(alert["start_time"])
             end_time = self.helper.timestamp_to_string(alert["end_time"])
             last_notification_time = self.helper.timestamp_to_string(
                 alert["last_notification_time"]
             )
 
-            alert_state_mapping = {
-                "ERROR": "[red]ERROR[/red]",
-                "ACTIVE": "[green]ACTIVE[/green]",
-                "ACKNOWLEDGED": "[blue]ACKNOWLEDGED[/blue]",
-                "DELETED": "[yellow]DELETED[/yellow]",
-            }
-
-            alert_state = alert_state_mapping.get(
-                alert["state"].upper(), alert["state"]
-            )
+            alert_state = ALERT_STATES.get(alert["state"].upper(), alert["state"])
 
-            severity_map = {
-                "1": "[bold red]CRIT[bold red]",
-                "2": "[red]HIGH[red]",
-                "3": "[yellow]MED[yellow]",
-                "4": "[yellow]LOW[/yellow]",
-                "5": "[blue]INFO[/blue]",
-            }
-            alert["severity"] = severity_map.get(
+            alert["severity"] = ALERT_SEVERITIES.get(
                 alert["severity"], str(alert["severity"])
             )
 